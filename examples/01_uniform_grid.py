@@ -6,28 +6,33 @@ This is the simplest use case - creating a global mesh with constant
 cell size everywhere on the sphere.
 """
 
-from mgrid import generate_mesh, save_grid
+from mgrid import generate_mesh, save_grid_async
 
 
-def main():
+def main(plot=False):
     # Generate a 30 km uniform resolution grid
     print("Generating 30 km uniform resolution grid...")
 
     grid = generate_mesh(
         resolution=30,  # 30 km cell size
         output_path='output/uniform_30km',
-        plot=True  # Generate diagnostic plot
+        plot=plot  # Diagnostic plot only with --plot
     )
 
-    # Print grid information
+    # Convert to MPAS format in the background
+    print("\nConverting to MPAS format...")
+    future = save_grid_async(grid, 'output/uniform_30km_mpas.nc')
+
+    # Print grid information while the file is written
     print("\n" + grid.summary())
 
-    # Convert to MPAS format
-    print("\nConverting to MPAS format...")
-    mpas_file = save_grid(grid, 'output/uniform_30km_mpas.nc')
+    mpas_file = future.result()
 
     print(f"\nDone! MPAS grid saved to: {mpas_file}")
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    # Pass --plot to save diagnostic plots (requires matplotlib)
+    main(plot='--plot' in sys.argv[1:])
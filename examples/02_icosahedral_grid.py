@@ -28,9 +28,11 @@ def main():
     level = 5
     print(f"Generating icosahedral grid at level {level}...")
 
+    # Re-runs reuse the cached level 5 mesh instead of calling JIGSAW again
     grid = generate_icosahedral(
         level=level,
-        output_path='output/icosahedral_level5'
+        output_path='output/icosahedral_level5',
+        cache_dir='output/mesh_cache'
     )
 
     print(grid.summary())
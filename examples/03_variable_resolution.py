@@ -15,7 +15,7 @@ from mgrid import (
 )
 
 
-def main():
+def main(plot=False):
     # Define a circular refinement region
     sao_paulo = CircularRegion(
         name='Sao_Paulo',
@@ -36,7 +36,7 @@ def main():
         regions=[sao_paulo],
         background_resolution=100,  # 100 km outside the region
         output_path='output/saopaulo_varres',
-        plot=True
+        plot=plot
     )
 
     print("\n" + grid.summary())
@@ -49,4 +49,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    # Pass --plot to save diagnostic plots (requires matplotlib)
+    main(plot='--plot' in sys.argv[1:])
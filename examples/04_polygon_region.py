@@ -14,7 +14,7 @@ from mgrid import (
 )
 
 
-def main():
+def main(plot=False):
     # Define Mato Grosso polygon (approximate boundaries)
     mato_grosso = PolygonRegion(
         name='Mato_Grosso',
@@ -35,24 +35,25 @@ def main():
     print(f"  Resolution: {mato_grosso.resolution} km")
 
     # Show region overview
-    try:
-        plot_region_overview(
-            [mato_grosso],
-            background_resolution=100,
-            lat_bounds=(-25, 5),
-            lon_bounds=(-75, -35),
-            output_file='output/mt_region_overview.png',
-            show=True
-        )
-    except ImportError:
-        print("(matplotlib not available, skipping plot)")
+    if plot:
+        try:
+            plot_region_overview(
+                [mato_grosso],
+                background_resolution=100,
+                lat_bounds=(-25, 5),
+                lon_bounds=(-75, -35),
+                output_file='output/mt_region_overview.png',
+                show=True
+            )
+        except ImportError:
+            print("(matplotlib not available, skipping plot)")
 
     # Generate the grid
     grid = generate_mesh(
         regions=[mato_grosso],
         background_resolution=100,
         output_path='output/mato_grosso_varres',
-        plot=True
+        plot=plot
     )
 
     print("\n" + grid.summary())
@@ -65,4 +66,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    # Pass --plot to save diagnostic plots (requires matplotlib)
+    main(plot='--plot' in sys.argv[1:])
@@ -21,7 +21,7 @@ from mgrid import (
 )
 
 
-def main():
+def main(plot=False):
     # Define nested regions (from coarse to fine)
 
     # Region 1: Mato Grosso state polygon (10 km)
@@ -55,17 +55,18 @@ def main():
     print("  3. Sapezal: 2 km")
 
     # Plot region overview
-    try:
-        plot_region_overview(
-            regions,
-            background_resolution=150,
-            lat_bounds=(-25, 0),
-            lon_bounds=(-70, -45),
-            output_file='output/nested_regions_overview.png',
-            show=True
-        )
-    except ImportError:
-        print("(matplotlib not available, skipping plot)")
+    if plot:
+        try:
+            plot_region_overview(
+                regions,
+                background_resolution=150,
+                lat_bounds=(-25, 0),
+                lon_bounds=(-70, -45),
+                output_file='output/nested_regions_overview.png',
+                show=True
+            )
+        except ImportError:
+            print("(matplotlib not available, skipping plot)")
 
     # Generate the grid
     # Note: grid_density may need to be smaller for very fine resolution
@@ -74,7 +75,7 @@ def main():
         background_resolution=150,
         grid_density=0.05,  # Adjust for finest resolution
         output_path='output/nested_varres',
-        plot=True
+        plot=plot
     )
 
     print("\n" + grid.summary())
@@ -87,4 +88,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    # Pass --plot to save diagnostic plots (requires matplotlib)
+    main(plot='--plot' in sys.argv[1:])
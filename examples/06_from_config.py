@@ -8,7 +8,13 @@ in a human-readable format.
 """
 
 from pathlib import Path
-from mgrid import generate_mesh, save_grid, load_config, validate_config
+from mgrid import (
+    generate_mesh,
+    save_grid,
+    load_config,
+    save_config,
+    validate_config
+)
 
 
 # Example configuration (saved to file)
@@ -48,17 +54,13 @@ EXAMPLE_CONFIG = {
 }
 
 
-def main():
-    import json
-
+def main(plot=False):
     # Create output directory
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)
 
     # Save example configuration
-    config_file = output_dir / 'example_config.json'
-    with open(config_file, 'w') as f:
-        json.dump(EXAMPLE_CONFIG, f, indent=2)
+    config_file = save_config(EXAMPLE_CONFIG, output_dir / 'example_config.json')
     print(f"Saved example configuration to: {config_file}")
 
     # Load and validate configuration
@@ -67,12 +69,17 @@ def main():
     validate_config(config)
     print("Configuration validated successfully!")
 
+    # Cache region distance fields so re-running after editing one
+    # region only recomputes that region
+    cache_dir = output_dir / 'cell_width_cache'
+
     # Generate grid from config
     print("\nGenerating grid from configuration...")
     grid = generate_mesh(
         config=config_file,
         output_path='output/from_config',
-        plot=True
+        plot=plot,
+        cache_dir=cache_dir
     )
 
     print("\n" + grid.summary())
@@ -88,10 +95,14 @@ def main():
     grid2 = generate_mesh(
         config=EXAMPLE_CONFIG,  # Dict instead of file
         output_path='output/from_dict',
-        generate_jigsaw=False  # Skip mesh generation, just compute cell width
+        generate_jigsaw=False,  # Skip mesh generation, just compute cell width
+        cache_dir=cache_dir  # Same regions and grid: fields come from the cache
     )
     print(f"Cell width computed: {grid2.min_resolution:.1f} - {grid2.max_resolution:.1f} km")
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+
+    # Pass --plot to save diagnostic plots (requires matplotlib)
+    main(plot='--plot' in sys.argv[1:])
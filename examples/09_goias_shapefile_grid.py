@@ -52,12 +52,14 @@ Shapefiles from DIVA-GIS (https://diva-gis.org/gdata)
 - BRA_adm3.shp: Municipal boundaries (Level 3)
 """
 
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import sys
 import numpy as np
 from pathlib import Path
-from shapely.geometry import Polygon
-from shapely.ops import transform
-import pyproj
 
 from mgrid import (
     generate_mesh,
@@ -71,7 +73,7 @@ from mgrid import (
 # GOIAS STATE POLYGON (simplified from shapefile, 65 vertices)
 # Original: 3311 points, simplified with tolerance=0.1
 # ============================================================================
-GOIAS_POLYGON = [
+GOIAS_POLYGON = np.array([
     [-12.4124, -50.1582],
     [-12.8399, -50.2926],
     [-13.2746, -49.3694],
@@ -137,7 +139,8 @@ GOIAS_POLYGON = [
     [-13.7331, -50.8717],
     [-12.7100, -50.4780],
     [-12.4124, -50.1582],
-]
+], dtype=np.float64)
+GOIAS_POLYGON.setflags(write=False)
 
 # ============================================================================
 # GOIANIA METROPOLITAN AREA DATA (from shapefile analysis)
@@ -160,6 +163,12 @@ METRO_DATA = {
     ]
 }
 
+# Metro circle outline for the plots (approximate, ~111 km per degree)
+_THETA = np.linspace(0, 2 * np.pi, 100)
+METRO_RADIUS_DEG = METRO_DATA['recommended_radius'] / 111.0
+METRO_CIRCLE_LONS = METRO_DATA['center'][1] + METRO_RADIUS_DEG * np.cos(_THETA)
+METRO_CIRCLE_LATS = METRO_DATA['center'][0] + METRO_RADIUS_DEG * np.sin(_THETA)
+
 # ============================================================================
 # GOIAS STATE DATA (from shapefile analysis)
 # ============================================================================
@@ -178,7 +187,28 @@ STATE_DATA = {
 STATE_BUFFER_KM = 50.0
 
 
-def create_buffered_polygon(polygon_coords, buffer_km):
+@functools.lru_cache(maxsize=None)
+def _get_transformers(src_epsg, dst_epsg):
+    """
+    Forward and inverse coordinate transforms between two EPSG codes.
+
+    Building a pyproj Transformer compiles a PROJ pipeline, so the pair is
+    created once per process and reused by later calls.
+
+    Returns
+    -------
+    tuple
+        (forward, inverse) transform functions taking (x, y) in
+        longitude/easting, latitude/northing order.
+    """
+    import pyproj
+
+    forward = pyproj.Transformer.from_crs(src_epsg, dst_epsg, always_xy=True)
+    inverse = pyproj.Transformer.from_crs(dst_epsg, src_epsg, always_xy=True)
+    return forward.transform, inverse.transform
+
+
+def create_buffered_polygon(polygon_coords, buffer_km, presimplify_m=500.0):
     """
     Create a buffered version of the polygon.
 
@@ -187,47 +217,53 @@ def create_buffered_polygon(polygon_coords, buffer_km):
 
     Parameters
     ----------
-    polygon_coords : list
-        List of [lat, lon] coordinates
+    polygon_coords : array_like
+        (N, 2) array of [lat, lon] coordinates
     buffer_km : float
         Buffer distance in kilometers
+    presimplify_m : float, optional
+        Douglas-Peucker tolerance in meters applied to the input polygon
+        before buffering (default: 500 m, well below the buffer distance).
+        The cost of the buffer grows with the vertex count, so detailed
+        shapefile outlines are reduced first. Use 0 to disable.
 
     Returns
     -------
     list
         Buffered polygon coordinates as [lat, lon] pairs
     """
-    # Convert to [lon, lat] for shapely (it expects x, y order)
-    coords_lonlat = [(lon, lat) for lat, lon in polygon_coords]
-
-    # Create shapely polygon
-    poly = Polygon(coords_lonlat)
-
-    # Define projections
-    # WGS84 (lat/lon)
-    wgs84 = pyproj.CRS('EPSG:4326')
-    # UTM zone 22S (appropriate for central Brazil/Goiás)
-    utm = pyproj.CRS('EPSG:32722')
-
-    # Create transformers
-    to_utm = pyproj.Transformer.from_crs(wgs84, utm, always_xy=True).transform
-    to_wgs84 = pyproj.Transformer.from_crs(utm, wgs84, always_xy=True).transform
-
-    # Transform to UTM, apply buffer, transform back
-    poly_utm = transform(to_utm, poly)
-    poly_buffered_utm = poly_utm.buffer(buffer_km * 1000)  # Convert km to meters
-    poly_buffered = transform(to_wgs84, poly_buffered_utm)
-
-    # Simplify to reduce vertex count
-    poly_simplified = poly_buffered.simplify(0.1, preserve_topology=True)
+    # Only needed here; keep them off the import path of the script
+    import shapely
+
+    # WGS84 (lat/lon) <-> UTM zone 22S (appropriate for central Brazil/Goiás)
+    to_utm, to_wgs84 = _get_transformers(4326, 32722)
+
+    # Project all vertices in one vectorized call and build the polygon
+    # directly from the coordinate array
+    coords = np.asarray(polygon_coords, dtype=np.float64)
+    lons = np.ascontiguousarray(coords[:, 1])
+    lats = np.ascontiguousarray(coords[:, 0])
+    x, y = to_utm(lons, lats)
+    poly_utm = shapely.polygons(np.column_stack([x, y]))
+    if presimplify_m > 0:
+        poly_utm = shapely.simplify(poly_utm, presimplify_m, preserve_topology=True)
+
+    # Apply buffer, transform back. Four segments per quarter circle keep
+    # the rounded corners coarse, so no simplification pass is needed
+    # afterwards. shapely.transform hands all ring coordinates over as one
+    # (N, 2) array, so the inverse projection is a single vectorized call
+    # rather than one callback per vertex
+    poly_buffered_utm = poly_utm.buffer(buffer_km * 1000, quad_segs=4)  # km to m
+    poly_buffered = shapely.transform(
+        poly_buffered_utm,
+        lambda xy: np.column_stack(to_wgs84(xy[:, 0], xy[:, 1]))
+    )
 
     # Extract coordinates and convert back to [lat, lon] format
-    buffered_coords = []
-    if poly_simplified.geom_type == 'Polygon':
-        for lon, lat in poly_simplified.exterior.coords[:-1]:  # Skip closing point
-            buffered_coords.append([lat, lon])
-
-    return buffered_coords
+    if poly_buffered.geom_type != 'Polygon':
+        return []
+    ring = np.asarray(poly_buffered.exterior.coords)[:-1]  # Skip closing point
+    return ring[:, ::-1].tolist()
 
 
 def create_goias_config():
@@ -359,29 +395,201 @@ def create_regions_from_config(config):
     return regions
 
 
-def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
+def _read_vector_file(path, where, keep):
     """
-    Create plots using Basemap with actual shapefile overlay.
+    Read the features of a vector file that match an attribute filter.
 
-    Shows both the original state boundary and the buffered 3km zone.
+    With pyogrio the SQL ``where`` filter runs inside GDAL (over Arrow when
+    pyarrow is installed), so non-matching features are never parsed.
+    Otherwise the file is read with the GeoPandas default engine and
+    ``keep`` (a function of the GeoDataFrame returning a boolean mask) is
+    applied afterwards.
+    """
+    import geopandas as gpd
+
+    try:
+        import pyogrio
+    except ImportError:
+        gdf = gpd.read_file(path)
+        return gdf[keep(gdf)].reset_index(drop=True)
+
+    try:
+        import pyarrow
+        use_arrow = True
+    except ImportError:
+        use_arrow = False
+
+    return gpd.read_file(path, engine='pyogrio', use_arrow=use_arrow, where=where)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_state_and_metro(state_shp, city_shp, state_name, metro_names):
+    """
+    Read a state outline and its metropolitan municipalities from shapefiles.
+
+    Only the features that are drawn are loaded: with pyogrio the attribute
+    filters run inside GDAL, so the rest of the national files is never
+    parsed. Results are cached per process; treat them as read-only.
+
+    Parameters
+    ----------
+    state_shp, city_shp : str
+        Paths to the level 1 (states) and level 3 (municipalities) files.
+    state_name : str
+        Value of NAME_1 to select.
+    metro_names : tuple of str
+        Values of NAME_3 to select.
+
+    Returns
+    -------
+    tuple
+        (state, metro_cities) GeoDataFrames.
+    """
+    def quote(value):
+        return "'" + value.replace("'", "''") + "'"
+
+    state = _read_vector_file(
+        state_shp,
+        where=f"NAME_1 = {quote(state_name)}",
+        keep=lambda gdf: gdf['NAME_1'] == state_name
+    )
+    metro_cities = _read_vector_file(
+        city_shp,
+        where=(
+            f"NAME_1 = {quote(state_name)} AND "
+            f"NAME_3 IN ({', '.join(quote(name) for name in metro_names)})"
+        ),
+        keep=lambda gdf: (
+            (gdf['NAME_1'] == state_name) & gdf['NAME_3'].isin(metro_names)
+        )
+    )
+    return state, metro_cities
+
+
+@functools.lru_cache(maxsize=1)
+def _plot_deps():
+    """
+    Import the plotting dependencies once.
+
+    Basemap alone takes about a second to import; keeping the imports here
+    defers that cost to the first plot and makes later calls a cache hit.
+
+    Returns
+    -------
+    tuple
+        (matplotlib.pyplot, matplotlib.patheffects, Basemap)
     """
     import matplotlib.pyplot as plt
     import matplotlib.patheffects as pe
     from mpl_toolkits.basemap import Basemap
-    import geopandas as gpd
 
-    # Load shapefiles
-    states = gpd.read_file('examples/BRA_adm/BRA_adm1.shp')
-    cities = gpd.read_file('examples/BRA_adm/BRA_adm3.shp')
-    goias_state = states[states['NAME_1'] == 'Goiás']
-    goias_cities = cities[cities['NAME_1'] == 'Goiás']
+    return plt, pe, Basemap
 
-    # Get metropolitan municipalities
-    metro_names = METRO_DATA['municipalities']
-    metro_cities = goias_cities[goias_cities['NAME_3'].isin(metro_names)]
 
-    # Create meshgrid for plotting
-    lons, lats = np.meshgrid(grid.lon, grid.lat)
+def _outline_xy(m, geometries):
+    """
+    Project the exterior rings of (multi)polygons as one line for m.plot.
+
+    All parts are extracted with shapely's vectorized API and projected in a
+    single call; rings are separated by NaN so one plot call draws them all.
+
+    Parameters
+    ----------
+    m : Basemap
+        Map used to project the coordinates.
+    geometries : GeoSeries or array_like
+        Polygon or MultiPolygon geometries in lon/lat.
+
+    Returns
+    -------
+    x, y : ndarray
+        Projected coordinates with NaN between rings.
+    """
+    import shapely
+
+    parts = shapely.get_parts(np.asarray(geometries))
+    coords, index = shapely.get_coordinates(
+        shapely.get_exterior_ring(parts), return_index=True
+    )
+    x, y = m(coords[:, 0], coords[:, 1])
+
+    # Insert the separators after projecting (NaN does not survive pyproj)
+    breaks = np.flatnonzero(np.diff(index)) + 1
+    return np.insert(x, breaks, np.nan), np.insert(y, breaks, np.nan)
+
+
+def _projected_axes(m, lon, lat):
+    """
+    Project 1-D grid axes for a cylindrical (Mercator) Basemap.
+
+    On a cylindrical projection x depends only on longitude and y only on
+    latitude, so the axes are projected once and broadcast to the grid
+    shape as read-only views instead of projecting a full meshgrid.
+
+    Returns
+    -------
+    x, y : ndarray
+        2-D (lat, lon) shaped float32 views of the projected coordinates
+        (meter-level precision is plenty for plotting).
+    """
+    x = np.asarray(m(lon, np.zeros_like(lon))[0], dtype=np.float32)
+    y = np.asarray(m(np.zeros_like(lat), lat)[1], dtype=np.float32)
+    shape = (lat.size, lon.size)
+    return np.broadcast_to(x, shape), np.broadcast_to(y[:, None], shape)
+
+
+def _cached_outline_xy(cache_dir, m, geometries, shapefile, selection):
+    """
+    Projected outlines from _outline_xy, reusing an .npz from previous runs.
+
+    The cache key covers the map projection and corners, the shapefile
+    path and modification time, and the selected features, so the file is
+    recomputed whenever any of them changes. Useful when iterating on plot
+    styling, where only matplotlib settings change between runs.
+    """
+    key_source = repr((
+        sorted(m.projparams.items()),
+        (m.llcrnrlon, m.llcrnrlat, m.urcrnrlon, m.urcrnrlat),
+        str(shapefile),
+        Path(shapefile).stat().st_mtime_ns,
+        selection,
+    ))
+    key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    cache_file = Path(cache_dir) / f"{key}.npz"
+
+    if cache_file.exists():
+        with np.load(cache_file) as data:
+            return data['x'], data['y']
+
+    x, y = _outline_xy(m, geometries)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(cache_file, x=x, y=y)
+    return x, y
+
+
+def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
+    """
+    Create plots using Basemap with actual shapefile overlay.
+
+    Shows both the original state boundary and the buffered 3km zone.
+    """
+    plt, pe, Basemap = _plot_deps()
+    from matplotlib.colors import BoundaryNorm
+
+    # Load the state outline and metropolitan municipalities (cached)
+    state_shp = 'examples/BRA_adm/BRA_adm1.shp'
+    city_shp = 'examples/BRA_adm/BRA_adm3.shp'
+    metro_names = tuple(METRO_DATA['municipalities'])
+    goias_state, metro_cities = _load_state_and_metro(
+        state_shp, city_shp, 'Goiás', metro_names
+    )
+
+    # Projected outlines are reused across runs
+    outline_cache = Path(output_dir) / ".outline_cache"
+
+    # Single precision is ample for a colormapped field (no copy if the grid
+    # is already float32)
+    cw32 = np.ascontiguousarray(grid.cell_width, dtype=np.float32)
 
     # =========================================================================
     # PLOT 1: Regional View with Real Shapefile Boundaries
@@ -403,59 +611,46 @@ def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
     m.drawmeridians(np.arange(-56, -42, 2), labels=[0, 0, 0, 1], fontsize=10)
 
     # Plot cell width
-    x, y = m(lons, lats)
+    x, y = _projected_axes(m, grid.lon, grid.lat)
+    # Discretely colored mesh: the field is on a regular lattice, so one
+    # rasterization pass replaces contour extraction
     levels = np.linspace(1, 30, 30)
-    cs = m.contourf(x, y, grid.cell_width, levels=levels, cmap='jet', extend='both')
+    norm = BoundaryNorm(levels, ncolors=plt.get_cmap('jet').N, extend='both')
+    cs = m.pcolormesh(x, y, cw32, cmap='jet', norm=norm, shading='nearest')
     cbar = m.colorbar(cs, location='right', pad='5%')
     cbar.set_label('Cell Width (km)', fontsize=12)
 
     # Plot BUFFERED polygon (3 km zone boundary) - yellow dashed
-    buff_lons = [p[1] for p in buffered_polygon] + [buffered_polygon[0][1]]
-    buff_lats = [p[0] for p in buffered_polygon] + [buffered_polygon[0][0]]
+    buff = np.asarray(buffered_polygon)
+    buff_lats = np.r_[buff[:, 0], buff[0, 0]]
+    buff_lons = np.r_[buff[:, 1], buff[0, 1]]
     bx, by = m(buff_lons, buff_lats)
     m.plot(bx, by, 'w-', linewidth=3)
     m.plot(bx, by, 'y--', linewidth=2, label=f'3 km zone ({STATE_BUFFER_KM:.0f} km buffer)')
 
     # Plot REAL Goias state boundary from shapefile - solid red
-    for geom in goias_state.geometry:
-        if geom.geom_type == 'Polygon':
-            coords = np.array(geom.exterior.coords)
-            px, py = m(coords[:, 0], coords[:, 1])
-            m.plot(px, py, 'w-', linewidth=3)
-            m.plot(px, py, 'r-', linewidth=2, label='Goiás State (real border)')
-        elif geom.geom_type == 'MultiPolygon':
-            for poly in geom.geoms:
-                coords = np.array(poly.exterior.coords)
-                px, py = m(coords[:, 0], coords[:, 1])
-                m.plot(px, py, 'w-', linewidth=3)
-                m.plot(px, py, 'r-', linewidth=2)
+    px, py = _cached_outline_xy(
+        outline_cache, m, goias_state.geometry, state_shp, 'Goiás'
+    )
+    m.plot(px, py, 'w-', linewidth=3)
+    m.plot(px, py, 'r-', linewidth=2, label='Goiás State (real border)')
 
     # Plot metropolitan area municipalities
-    for geom in metro_cities.geometry:
-        if geom.geom_type == 'Polygon':
-            coords = np.array(geom.exterior.coords)
-            px, py = m(coords[:, 0], coords[:, 1])
-            m.plot(px, py, 'm-', linewidth=1.5, alpha=0.7)
-        elif geom.geom_type == 'MultiPolygon':
-            for poly in geom.geoms:
-                coords = np.array(poly.exterior.coords)
-                px, py = m(coords[:, 0], coords[:, 1])
-                m.plot(px, py, 'm-', linewidth=1.5, alpha=0.7)
+    px, py = _cached_outline_xy(
+        outline_cache, m, metro_cities.geometry, city_shp, metro_names
+    )
+    m.plot(px, py, 'm-', linewidth=1.5, alpha=0.7)
 
     # Draw metro circle
-    theta = np.linspace(0, 2 * np.pi, 100)
-    metro_center = METRO_DATA['center']
-    metro_radius_deg = METRO_DATA['recommended_radius'] / 111.0
-    metro_lons = metro_center[1] + metro_radius_deg * np.cos(theta)
-    metro_lats = metro_center[0] + metro_radius_deg * np.sin(theta)
-    mx, my = m(metro_lons, metro_lats)
+    mx, my = m(METRO_CIRCLE_LONS, METRO_CIRCLE_LATS)
     m.plot(mx, my, 'w-', linewidth=2.5)
     m.plot(mx, my, 'c-', linewidth=2, label='Metro Area (1 km zone)')
 
     # Regional buffer
     regional_poly = config["regions"][0]["polygon"]
-    poly_lons = [p[1] for p in regional_poly] + [regional_poly[0][1]]
-    poly_lats = [p[0] for p in regional_poly] + [regional_poly[0][0]]
+    regional = np.asarray(regional_poly)
+    poly_lats = np.r_[regional[:, 0], regional[0, 0]]
+    poly_lons = np.r_[regional[:, 1], regional[0, 1]]
     rpx, rpy = m(poly_lons, poly_lats)
     m.plot(rpx, rpy, 'w-', linewidth=2)
     m.plot(rpx, rpy, 'k--', linewidth=1.5, label='Regional Buffer (5 km)')
@@ -506,31 +701,31 @@ def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
     m2.drawmeridians(np.arange(-51, -47, 0.5), labels=[0, 0, 0, 1], fontsize=10)
 
     # Plot cell width
-    x2, y2 = m2(lons, lats)
+    x2, y2 = _projected_axes(m2, grid.lon, grid.lat)
     levels2 = np.linspace(1, 5, 20)
-    cs2 = m2.contourf(x2, y2, grid.cell_width, levels=levels2, cmap='jet', extend='both')
+    norm2 = BoundaryNorm(levels2, ncolors=plt.get_cmap('jet').N, extend='both')
+    cs2 = m2.pcolormesh(x2, y2, cw32, cmap='jet', norm=norm2, shading='nearest')
     cbar2 = m2.colorbar(cs2, location='right', pad='5%')
     cbar2.set_label('Cell Width (km)', fontsize=12)
 
     # Plot ALL metropolitan municipalities with labels
-    for idx, row in metro_cities.iterrows():
-        geom = row.geometry
-        name = row['NAME_3']
-
-        if geom.geom_type == 'Polygon':
-            coords = np.array(geom.exterior.coords)
-            px, py = m2(coords[:, 0], coords[:, 1])
-            m2.plot(px, py, 'w-', linewidth=2)
-            m2.plot(px, py, 'm-', linewidth=1.5)
-
-            # Label municipality
-            cx, cy = m2(geom.centroid.x, geom.centroid.y)
-            ax.text(cx, cy, name, fontsize=7, ha='center', va='center',
-                    color='white', fontweight='bold',
-                    path_effects=[pe.withStroke(linewidth=1.5, foreground='black')])
+    px, py = _cached_outline_xy(
+        outline_cache, m2, metro_cities.geometry, city_shp, metro_names
+    )
+    m2.plot(px, py, 'w-', linewidth=2)
+    m2.plot(px, py, 'm-', linewidth=1.5)
+
+    # Label municipalities at a point guaranteed to lie inside each one
+    # (a centroid can fall outside a concave or multi-part outline)
+    label_points = metro_cities.geometry.representative_point()
+    cxs, cys = m2(label_points.x.to_numpy(), label_points.y.to_numpy())
+    for name, cx, cy in zip(metro_cities['NAME_3'], cxs, cys):
+        ax.text(cx, cy, name, fontsize=7, ha='center', va='center',
+                color='white', fontweight='bold',
+                path_effects=[pe.withStroke(linewidth=1.5, foreground='black')])
 
     # Draw metro circle
-    mx2, my2 = m2(metro_lons, metro_lats)
+    mx2, my2 = m2(METRO_CIRCLE_LONS, METRO_CIRCLE_LATS)
     m2.plot(mx2, my2, 'c-', linewidth=3, label=f'Metro Circle ({METRO_DATA["recommended_radius"]:.0f} km)')
 
     # Mark metro centroid
@@ -552,7 +747,7 @@ def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
     # =========================================================================
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    hist_data = grid.cell_width.flatten()
+    hist_data = grid.cell_width.ravel()  # View, no copy of the grid
     bins = np.linspace(0, 32, 65)
 
     ax.hist(hist_data, bins=bins, edgecolor='black', alpha=0.7, color='steelblue')
@@ -586,6 +781,26 @@ def plot_with_basemap_and_shapefile(grid, config, output_dir, buffered_polygon):
     plt.close()
 
 
+def _buffered_output(func):
+    """
+    Collect everything func prints and write it to stdout in one call.
+
+    The report functions below issue dozens of print() calls; on unbuffered
+    streams (CI logs, pipes) each one is a separate write.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@_buffered_output
 def print_grid_info(config):
     """Print detailed grid configuration information."""
     print("=" * 70)
@@ -828,6 +1043,7 @@ def main(run_jigsaw=False, global_grid_file=None, num_partitions=None):
     return results
 
 
+@_buffered_output
 def print_summary(results, output_dir, run_jigsaw, num_partitions):
     """Print final summary of all generated files."""
     print("\n" + "=" * 70)
@@ -922,12 +1138,11 @@ def generate_limited_area_pts(config, buffered_polygon, output_dir):
 
     # Use the buffered polygon (which includes the 50km buffer)
     # This ensures the entire 3km resolution zone is included in the regional cut
-    polygon_tuples = [(p[0], p[1]) for p in buffered_polygon]
+    buffered = np.asarray(buffered_polygon, dtype=np.float64)
+    polygon_tuples = buffered.tolist()
 
     # Calculate centroid as the inside point
-    lats = [p[0] for p in buffered_polygon]
-    lons = [p[1] for p in buffered_polygon]
-    centroid = (sum(lats) / len(lats), sum(lons) / len(lons))
+    centroid = tuple(buffered.mean(axis=0).tolist())
 
     # Generate custom (polygon) .pts file for the state region
     pts_file = generate_pts_file(
@@ -951,11 +1166,9 @@ def generate_limited_area_pts(config, buffered_polygon, output_dir):
 
     # Generate regional buffer (square) .pts file
     regional_poly = config["regions"][0]["polygon"]
-    regional_tuples = [(p[0], p[1]) for p in regional_poly]
-    regional_centroid = (
-        sum(p[0] for p in regional_poly) / len(regional_poly),
-        sum(p[1] for p in regional_poly) / len(regional_poly)
-    )
+    regional = np.asarray(regional_poly, dtype=np.float64)
+    regional_tuples = regional.tolist()
+    regional_centroid = tuple(regional.mean(axis=0).tolist())
 
     regional_pts = generate_pts_file(
         output_path=output_dir / "goias_regional.pts",
@@ -13,29 +13,143 @@ This example demonstrates how to:
 Author: MONAN Development Team
 """
 
+import functools
+import hashlib
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import geopandas as gpd
 import numpy as np
+import shapely
 from shapely.geometry import Polygon, MultiPolygon
-from shapely.ops import transform
 import pyproj
 from pathlib import Path
 
+# pyogrio reads whole columns at once instead of one record at a time
+# (fiona); Arrow transport avoids building intermediate Python objects
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
 
-def load_shapefile(shapefile_path):
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Visvalingam-Whyatt simplification (optional, Rust-backed)
+try:
+    from simplification.cutil import simplify_coords_vw
+except ImportError:
+    simplify_coords_vw = None
+
+
+def read_vector_file(path, **kwargs):
+    """
+    Read a vector file with the fastest available engine.
+
+    Uses pyogrio (with Arrow when pyarrow is installed) and falls back to
+    the GeoPandas default engine otherwise. Extra keyword arguments are
+    passed on to ``gpd.read_file``.
+    """
+    if pyogrio is None:
+        return gpd.read_file(path, **kwargs)
+    return gpd.read_file(
+        path, engine='pyogrio', use_arrow=pyarrow is not None, **kwargs
+    )
+
+
+# GeoParquet mirrors of loaded shapefiles live in the user cache, never
+# next to the (possibly tracked) source data
+VECTOR_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'mgrid' / 'vector'
+
+
+# Shapefile components that affect what is read (attributes, index,
+# CRS, encoding); any of them changing invalidates the mirror
+SHAPEFILE_PARTS = ('.shp', '.dbf', '.shx', '.prj', '.cpg')
+
+
+def _parquet_cache_path(shapefile_path):
+    """GeoParquet mirror path, keyed by the source path and the size and
+    mtime of the .shp and each sidecar file present."""
+    path = Path(shapefile_path).resolve()
+    parts = [str(path)]
+    for suffix in SHAPEFILE_PARTS:
+        part = path.with_suffix(suffix)
+        if part.exists():
+            stat = part.stat()
+            parts.append(f"{suffix}:{stat.st_size}:{stat.st_mtime_ns}")
+    key = hashlib.blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+    return VECTOR_CACHE_DIR / f"{path.stem}.{key}.parquet"
+
+
+def _write_parquet_cache(gdf, cache_path):
+    """Write the GeoParquet mirror atomically; skip it if not writable."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named temporary file first so concurrent runs
+        # never read a partially written mirror
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f'{cache_path.name}.',
+            suffix='.tmp', delete=False
+        ) as f:
+            tmp_name = f.name
+            try:
+                gdf.to_parquet(f)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_name)
+                raise
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        pass  # read-only location: just skip the cache
+
+
+def load_shapefile(shapefile_path, where=None):
     """
     Load a shapefile and display basic information.
 
+    Unfiltered loads are mirrored to a GeoParquet file in the user cache
+    (``~/.cache/mgrid/vector``) on first read, when pyarrow is installed;
+    later runs read the columnar mirror instead of parsing the shapefile.
+    A change in the size or mtime of the shapefile or its sidecar files
+    produces a new mirror, and an unreadable mirror is rebuilt.
+
     Parameters
     ----------
     shapefile_path : str
         Path to the shapefile (.shp)
+    where : str, optional
+        SQL attribute filter (e.g. "NAME_1 = 'Goiás'") applied by the
+        reader, so only matching features are parsed.
 
     Returns
     -------
     gdf : GeoDataFrame
         Loaded GeoDataFrame
     """
-    gdf = gpd.read_file(shapefile_path)
+    if where is not None:
+        gdf = read_vector_file(shapefile_path, where=where)
+    elif pyarrow is None:
+        gdf = read_vector_file(shapefile_path)
+    else:
+        cache_path = _parquet_cache_path(shapefile_path)
+        gdf = None
+        if cache_path.exists():
+            try:
+                gdf = gpd.read_parquet(cache_path)
+            except (OSError, ValueError):
+                # Truncated or corrupt mirror: drop it and re-read the source
+                try:
+                    cache_path.unlink()
+                except OSError:
+                    pass
+        if gdf is None:
+            gdf = read_vector_file(shapefile_path)
+            _write_parquet_cache(gdf, cache_path)
 
     print(f"Loaded: {shapefile_path}")
     print(f"  Rows: {len(gdf)}")
@@ -124,7 +238,92 @@ def get_polygon_bounds(geometry):
     return bounds
 
 
-def get_polygon_centroid(geometry):
+def bounds_from_array(vertices):
+    """
+    Get the bounding box of already extracted vertices.
+
+    One NumPy reduction over the array, no GEOS call on the geometry.
+
+    Parameters
+    ----------
+    vertices : array_like
+        (N, 2) array of [lat, lon] coordinates
+
+    Returns
+    -------
+    bounds : dict
+        Dictionary with min_lon, max_lon, min_lat, max_lat
+    """
+    arr = np.asarray(vertices, dtype=np.float64)
+    mins = arr.min(axis=0)
+    maxs = arr.max(axis=0)
+
+    bounds = {
+        'min_lon': float(mins[1]),
+        'max_lon': float(maxs[1]),
+        'min_lat': float(mins[0]),
+        'max_lat': float(maxs[0])
+    }
+
+    print(f"\nBounds:")
+    print(f"  Latitude:  [{bounds['min_lat']:.4f}, {bounds['max_lat']:.4f}]")
+    print(f"  Longitude: [{bounds['min_lon']:.4f}, {bounds['max_lon']:.4f}]")
+
+    return bounds
+
+
+def bounds_many(gdf):
+    """
+    Get the bounding boxes of all geometries in one vectorized call.
+
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+        Loaded GeoDataFrame
+
+    Returns
+    -------
+    bounds : DataFrame
+        One row per geometry with columns minx, miny, maxx, maxy
+    """
+    return gdf.geometry.bounds
+
+
+def centroids_many(gdf):
+    """
+    Get the centroids of all geometries in one vectorized call.
+
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+        Loaded GeoDataFrame
+
+    Returns
+    -------
+    centroids : ndarray
+        (N, 2) array of [lat, lon] centroids
+    """
+    coords = shapely.get_coordinates(shapely.centroid(gdf.geometry.to_numpy()))
+    return np.ascontiguousarray(coords[:, ::-1])
+
+
+def fast_centroid(geometry):
+    """
+    Approximate the centroid of a geometry by the mean of its vertices.
+
+    Good enough to pick a UTM zone or a rough inside point, and avoids the
+    area-weighted GEOS centroid computation.
+
+    Returns
+    -------
+    centroid : tuple
+        (x, y), i.e. (longitude, latitude) for geographic coordinates
+    """
+    coords = shapely.get_coordinates(geometry)
+    return float(coords[:, 0].mean()), float(coords[:, 1].mean())
+
+
+def get_polygon_centroid(geometry, approximate=False):
     """
     Get the centroid of a polygon.
 
@@ -132,15 +331,22 @@ def get_polygon_centroid(geometry):
     ----------
     geometry : Polygon or MultiPolygon
         The geometry
+    approximate : bool, optional
+        Use the vertex mean (fast_centroid) instead of the exact
+        area-weighted centroid.
 
     Returns
     -------
     centroid : tuple
         (latitude, longitude) of centroid
     """
-    centroid = geometry.centroid
+    if approximate:
+        lon, lat = fast_centroid(geometry)
+    else:
+        centroid = geometry.centroid
+        lon, lat = centroid.x, centroid.y
 
-    result = (centroid.y, centroid.x)  # (lat, lon)
+    result = (lat, lon)
 
     print(f"\nCentroid:")
     print(f"  Latitude:  {result[0]:.4f}")
@@ -149,7 +355,84 @@ def get_polygon_centroid(geometry):
     return result
 
 
-def extract_polygon_vertices(geometry, simplify_tolerance=None):
+def simplify_geometry(geometry, tolerance, preserve_topology=False):
+    """
+    Simplify a geometry, preferring plain Douglas-Peucker.
+
+    The topology-preserving algorithm is much slower; it is only used if
+    requested or if plain Douglas-Peucker produces an invalid or empty
+    result (e.g. a self-intersecting ring).
+
+    Parameters
+    ----------
+    geometry : Polygon or MultiPolygon
+        The geometry
+    tolerance : float
+        Simplification tolerance (in the units of the geometry)
+    preserve_topology : bool
+        Always use the topology-preserving algorithm
+
+    Returns
+    -------
+    geometry : Polygon or MultiPolygon
+        The simplified geometry
+    """
+    if not preserve_topology:
+        simplified = shapely.simplify(geometry, tolerance, preserve_topology=False)
+        if simplified.is_valid and not simplified.is_empty:
+            return simplified
+    return shapely.simplify(geometry, tolerance, preserve_topology=True)
+
+
+def simplify_geometry_vw(geometry, epsilon):
+    """
+    Simplify a geometry with the Visvalingam-Whyatt algorithm.
+
+    Vertices are removed by the area of the triangle they form with their
+    neighbours, which keeps the salient features of boundary-like shapes
+    at a lower vertex count than Douglas-Peucker. Rings that collapse
+    below a triangle are dropped.
+
+    Parameters
+    ----------
+    geometry : Polygon or MultiPolygon
+        The geometry
+    epsilon : float
+        Area threshold (in squared units of the geometry)
+
+    Returns
+    -------
+    geometry : Polygon or MultiPolygon
+        The simplified geometry
+    """
+    if simplify_coords_vw is None:
+        raise ImportError(
+            "method='vw' requires the 'simplification' package "
+            "(pip install simplification)"
+        )
+
+    def simplify_ring(ring):
+        coords = simplify_coords_vw(shapely.get_coordinates(ring), epsilon)
+        coords = np.asarray(coords, dtype=np.float64)
+        return coords if len(coords) >= 4 else None
+
+    polygons = []
+    for part in shapely.get_parts(geometry):
+        shell = simplify_ring(part.exterior)
+        if shell is None:
+            continue
+        holes = [h for h in map(simplify_ring, part.interiors) if h is not None]
+        polygons.append(Polygon(shell, holes))
+
+    if not polygons:
+        return geometry
+    if len(polygons) == 1:
+        return polygons[0]
+    return MultiPolygon(polygons)
+
+
+def extract_polygon_vertices(geometry, simplify_tolerance=None,
+                             preserve_topology=False, method='dp'):
     """
     Extract vertices from a polygon geometry.
 
@@ -158,52 +441,86 @@ def extract_polygon_vertices(geometry, simplify_tolerance=None):
     geometry : Polygon or MultiPolygon
         The geometry
     simplify_tolerance : float, optional
-        Tolerance for simplification (in degrees). If None, no simplification.
+        Tolerance for simplification (in degrees, or squared degrees for
+        ``method='vw'``). If None, no simplification.
+    preserve_topology : bool, optional
+        Always use the slower topology-preserving simplification (default:
+        only when plain Douglas-Peucker gives an invalid result).
+    method : {'dp', 'vw'}, optional
+        Simplification algorithm: Douglas-Peucker (shapely, default) or
+        Visvalingam-Whyatt (``simplification`` package; falls back to
+        Douglas-Peucker with a note when it is not installed).
 
     Returns
     -------
-    vertices : list
-        List of [lat, lon] coordinates
+    vertices : ndarray
+        (N, 2) array of [lat, lon] coordinates
     """
     # Simplify if requested
     if simplify_tolerance is not None:
         original_count = count_vertices(geometry)
-        geometry = geometry.simplify(simplify_tolerance, preserve_topology=True)
+        if method == 'vw' and simplify_coords_vw is None:
+            # The VW threshold is an area: use its square root as the
+            # Douglas-Peucker distance tolerance
+            print("\nNote: the 'simplification' package is not installed "
+                  "(pip install simplification); using Douglas-Peucker "
+                  "instead of Visvalingam-Whyatt")
+            method = 'dp'
+            simplify_tolerance = simplify_tolerance ** 0.5
+        if method == 'vw':
+            geometry = simplify_geometry_vw(geometry, simplify_tolerance)
+        elif method == 'dp':
+            geometry = simplify_geometry(
+                geometry, simplify_tolerance,
+                preserve_topology=preserve_topology
+            )
+        else:
+            raise ValueError(f"Unknown simplification method: {method!r}")
         simplified_count = count_vertices(geometry)
-        print(f"\nSimplification:")
-        print(f"  Tolerance: {simplify_tolerance} degrees")
+        print(f"\nSimplification ({method.upper()}):")
+        print(f"  Tolerance: {simplify_tolerance} degrees"
+              f"{'^2' if method == 'vw' else ''}")
         print(f"  Original vertices: {original_count}")
         print(f"  Simplified vertices: {simplified_count}")
         print(f"  Reduction: {100*(1-simplified_count/original_count):.1f}%")
 
-    vertices = []
-
-    if geometry.geom_type == 'Polygon':
-        # Get exterior ring coordinates (skip last point which equals first)
-        coords = list(geometry.exterior.coords)[:-1]
-        for lon, lat in coords:
-            vertices.append([lat, lon])
-
-    elif geometry.geom_type == 'MultiPolygon':
-        # Get the largest polygon
-        largest = max(geometry.geoms, key=lambda p: p.area)
-        coords = list(largest.exterior.coords)[:-1]
-        for lon, lat in coords:
-            vertices.append([lat, lon])
+    if geometry.geom_type == 'MultiPolygon':
+        # Get the largest polygon (all part areas in one vectorized call)
+        parts = shapely.get_parts(geometry)
+        geometry = parts[int(np.argmax(shapely.area(parts)))]
         print(f"  Note: MultiPolygon - using largest polygon only")
 
+    # Exterior ring as an (N, 2) [lon, lat] array in one call (skip last
+    # point which equals first), then swap the columns to [lat, lon]
+    coords = shapely.get_coordinates(geometry.exterior)[:-1]
+    vertices = np.ascontiguousarray(coords[:, ::-1])
+
     print(f"\nExtracted vertices: {len(vertices)}")
 
     return vertices
 
 
 def count_vertices(geometry):
-    """Count total vertices in a geometry."""
-    if geometry.geom_type == 'Polygon':
-        return len(geometry.exterior.coords) - 1
-    elif geometry.geom_type == 'MultiPolygon':
-        return sum(len(p.exterior.coords) - 1 for p in geometry.geoms)
-    return 0
+    """Count total exterior ring vertices (without closing points) in a geometry."""
+    if geometry.geom_type not in ('Polygon', 'MultiPolygon'):
+        return 0
+    # Read the counts from GEOS instead of materializing the coordinates
+    rings = shapely.get_exterior_ring(shapely.get_parts(geometry))
+    return int(shapely.get_num_coordinates(rings).sum()) - len(rings)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_utm_transformers(zone, hemisphere):
+    """
+    Return cached (to_utm, to_wgs84) transform functions for a UTM zone.
+
+    Building a pyproj Transformer parses the CRS definitions on every call,
+    so buffering many polygons in the same zone reuses one pair.
+    """
+    utm_crs = pyproj.CRS(f"+proj=utm +zone={zone} +{hemisphere} +datum=WGS84")
+    to_utm = pyproj.Transformer.from_crs(4326, utm_crs, always_xy=True)
+    to_wgs84 = pyproj.Transformer.from_crs(utm_crs, 4326, always_xy=True)
+    return to_utm.transform, to_wgs84.transform
 
 
 def create_buffered_polygon(vertices, buffer_km):
@@ -212,48 +529,56 @@ def create_buffered_polygon(vertices, buffer_km):
 
     Parameters
     ----------
-    vertices : list
-        List of [lat, lon] coordinates
+    vertices : array_like
+        (N, 2) array of [lat, lon] coordinates
     buffer_km : float
         Buffer distance in kilometers
 
     Returns
     -------
-    buffered_vertices : list
-        List of [lat, lon] coordinates for buffered polygon
+    buffered_vertices : ndarray
+        (M, 2) array of [lat, lon] coordinates for buffered polygon
     """
-    # Convert to [lon, lat] for shapely
-    coords_lonlat = [(v[1], v[0]) for v in vertices]
-
-    # Create polygon
-    poly = Polygon(coords_lonlat)
-
-    # Define projections (WGS84 to UTM)
-    wgs84 = pyproj.CRS('EPSG:4326')
+    # Create polygon, swapping to [lon, lat] for shapely
+    coords = np.asarray(vertices, dtype=np.float64)
+    lons = np.ascontiguousarray(coords[:, 1])
+    lats = np.ascontiguousarray(coords[:, 0])
+    poly = Polygon(np.column_stack([lons, lats]))
 
     # Determine appropriate UTM zone based on centroid
-    centroid = poly.centroid
-    utm_zone = int((centroid.x + 180) / 6) + 1
-    hemisphere = 'north' if centroid.y >= 0 else 'south'
-    utm_crs = pyproj.CRS(f"+proj=utm +zone={utm_zone} +{hemisphere} +datum=WGS84")
-
-    # Create transformers
-    to_utm = pyproj.Transformer.from_crs(wgs84, utm_crs, always_xy=True).transform
-    to_wgs84 = pyproj.Transformer.from_crs(utm_crs, wgs84, always_xy=True).transform
+    cx, cy = fast_centroid(poly)
+    utm_zone = int((cx + 180) / 6) + 1
+    hemisphere = 'north' if cy >= 0 else 'south'
+    to_utm, to_wgs84 = _get_utm_transformers(utm_zone, hemisphere)
+
+    # Transform, buffer, transform back. Each projection is a single
+    # vectorized transformer call on coordinate arrays, not one call per
+    # vertex as with shapely.ops.transform
+    x, y = to_utm(lons, lats)
+    poly_utm = Polygon(np.column_stack([x, y]))
+
+    # Repair malformed rings (self-intersections are common in BRA_adm3)
+    # up front with one linear-time GEOS call, so buffering never has to
+    # work on an invalid polygon
+    if not poly_utm.is_valid:
+        print(f"  Repairing invalid polygon: {shapely.is_valid_reason(poly_utm)}")
+        poly_utm = shapely.make_valid(poly_utm)
 
-    # Transform, buffer, transform back
-    poly_utm = transform(to_utm, poly)
     poly_buffered = poly_utm.buffer(buffer_km * 1000)  # km to meters
-    poly_back = transform(to_wgs84, poly_buffered)
+    poly_back = shapely.transform(
+        poly_buffered,
+        lambda xy: np.column_stack(to_wgs84(xy[:, 0], xy[:, 1]))
+    )
 
-    # Simplify to reduce vertices
-    poly_simplified = poly_back.simplify(0.05, preserve_topology=True)
+    # Simplify to reduce vertices (plain Douglas-Peucker on a valid input)
+    poly_simplified = simplify_geometry(poly_back, 0.05)
+    if poly_simplified.geom_type == 'MultiPolygon':
+        parts = shapely.get_parts(poly_simplified)
+        poly_simplified = parts[int(np.argmax(shapely.area(parts)))]
 
     # Extract coordinates
-    buffered_vertices = []
-    coords = list(poly_simplified.exterior.coords)[:-1]
-    for lon, lat in coords:
-        buffered_vertices.append([lat, lon])
+    coords = shapely.get_coordinates(poly_simplified.exterior)[:-1]
+    buffered_vertices = np.ascontiguousarray(coords[:, ::-1])
 
     print(f"\nBuffer applied:")
     print(f"  Buffer distance: {buffer_km} km")
@@ -269,8 +594,8 @@ def export_to_python(vertices, variable_name="POLYGON"):
 
     Parameters
     ----------
-    vertices : list
-        List of [lat, lon] coordinates
+    vertices : array_like
+        (N, 2) array of [lat, lon] coordinates
     variable_name : str
         Name for the Python variable
 
@@ -279,42 +604,125 @@ def export_to_python(vertices, variable_name="POLYGON"):
     code : str
         Python code string
     """
-    lines = [f"{variable_name} = ["]
-    for lat, lon in vertices:
-        lines.append(f"    [{lat:.4f}, {lon:.4f}],")
-    lines.append("]")
+    # Format all rows in one pass over the (N, 2) array
+    body = io.StringIO()
+    np.savetxt(body, np.asarray(vertices, dtype=np.float64).reshape(-1, 2),
+               fmt="    [%.4f, %.4f],")
 
-    return "\n".join(lines)
+    return f"{variable_name} = [\n{body.getvalue()}]"
 
 
-def export_to_pts(vertices, centroid, name, output_path):
+def export_to_pts(vertices, centroid, name, output_path, verbose=True):
     """
     Export as MPAS Limited-Area .pts file.
 
     Parameters
     ----------
-    vertices : list
-        List of [lat, lon] coordinates
+    vertices : array_like
+        (N, 2) array of [lat, lon] coordinates
     centroid : tuple
         (lat, lon) of centroid (inside point)
     name : str
         Region name
     output_path : str
         Path for output file
+    verbose : bool
+        Print the output path
     """
-    lines = [
-        f"Name: {name}",
-        "Type: custom",
-        f"Point: {centroid[0]}, {centroid[1]}"
-    ]
-
-    for lat, lon in vertices:
-        lines.append(f"{lat}, {lon}")
+    header = (
+        f"Name: {name}\n"
+        "Type: custom\n"
+        f"Point: {centroid[0]}, {centroid[1]}\n"
+    )
 
+    # Vertex block written straight from the (N, 2) array (1e-6 degrees is
+    # about 0.1 m)
     with open(output_path, 'w') as f:
-        f.write('\n'.join(lines))
+        f.write(header)
+        np.savetxt(f, np.asarray(vertices, dtype=np.float64).reshape(-1, 2),
+                   fmt="%.6f, %.6f")
+
+    if verbose:
+        print(f"\nExported to: {output_path}")
 
-    print(f"\nExported to: {output_path}")
+
+def process_region(name, geometry, output_dir, simplify_tolerance=0.1):
+    """
+    Simplify one region and export it as a .pts file, without printing.
+
+    Parameters
+    ----------
+    name : str
+        Region name
+    geometry : Polygon or MultiPolygon
+        The region's geometry
+    output_dir : Path
+        Directory for the .pts file
+    simplify_tolerance : float
+        Simplification tolerance (in degrees)
+
+    Returns
+    -------
+    output_path : Path
+        Path to the written .pts file
+    """
+    geometry = simplify_geometry(geometry, simplify_tolerance)
+    if geometry.geom_type == 'MultiPolygon':
+        parts = shapely.get_parts(geometry)
+        geometry = parts[int(np.argmax(shapely.area(parts)))]
+
+    coords = shapely.get_coordinates(geometry.exterior)[:-1]
+    inside = geometry.representative_point()
+
+    slug = name.lower().replace(' ', '_')
+    output_path = Path(output_dir) / f"{slug}.pts"
+    export_to_pts(coords[:, ::-1], (inside.y, inside.x), slug, output_path,
+                  verbose=False)
+    return output_path
+
+
+def export_all_regions(gdf, name_column, output_dir, simplify_tolerance=0.1,
+                       max_workers=None):
+    """
+    Export every region of a GeoDataFrame as a .pts file, in parallel.
+
+    The file is read once by the caller; the workers only receive the name
+    and geometry arrays. Threads are enough because shapely releases the
+    GIL inside GEOS, and they avoid pickling geometries to subprocesses.
+
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+        Loaded GeoDataFrame
+    name_column : str
+        Column containing region names
+    output_dir : Path
+        Directory for the .pts files (created if needed)
+    simplify_tolerance : float
+        Simplification tolerance (in degrees)
+    max_workers : int, optional
+        Number of worker threads (default: ThreadPoolExecutor's default)
+
+    Returns
+    -------
+    paths : list of Path
+        Paths to the written .pts files
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    names = gdf[name_column].to_numpy()
+    geometries = gdf.geometry.to_numpy()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        paths = list(pool.map(
+            lambda item: process_region(item[0], item[1], output_dir,
+                                        simplify_tolerance),
+            zip(names, geometries)
+        ))
+
+    print(f"\nExported {len(paths)} regions to: {output_dir}")
+    return paths
 
 
 # =============================================================================
@@ -348,16 +756,17 @@ def main():
     # Extract Goiás
     goias_geom = extract_polygon(states, 'NAME_1', 'Goiás')
 
-    # Get bounds and centroid
-    bounds = get_polygon_bounds(goias_geom)
-    centroid = get_polygon_centroid(goias_geom)
-
     # Extract vertices (simplified)
     vertices = extract_polygon_vertices(goias_geom, simplify_tolerance=0.1)
 
+    # Get bounds and centroid of the full (unsimplified) state outline;
+    # shapely returns (lon, lat) coordinates, flip them to [lat, lon]
+    bounds = bounds_from_array(shapely.get_coordinates(goias_geom)[:, ::-1])
+    centroid = get_polygon_centroid(goias_geom)
+
     # Show first 5 vertices
     print("\nFirst 5 vertices [lat, lon]:")
-    for v in vertices[:5]:
+    for v in vertices[:5].tolist():
         print(f"  {v}")
 
     # Export as Python code
@@ -385,14 +794,15 @@ def main():
     print("EXAMPLE 3: Extract Municipalities (Cities)")
     print("-" * 70)
 
-    # Load municipalities shapefile
+    # Load only the municipalities of Goiás: the filter runs in the reader,
+    # so the other ~5000 municipalities are never parsed
     cities_shp = shapefile_dir / "BRA_adm3.shp"
-    cities = load_shapefile(cities_shp)
-
-    # Filter cities in Goiás
-    goias_cities = cities[cities['NAME_1'] == 'Goiás']
+    goias_cities = load_shapefile(cities_shp, where="NAME_1 = 'Goiás'")
     print(f"\nCities in Goiás: {len(goias_cities)}")
 
+    # Index by municipality name for hash lookups instead of column scans
+    goias_cities = goias_cities.set_index('NAME_3', drop=False)
+
     # Extract Goiânia (note: shapefile uses 'Goiania' without accent)
     goiania_geom = extract_polygon(goias_cities, 'NAME_3', 'Goiania')
     goiania_bounds = get_polygon_bounds(goiania_geom)
@@ -412,17 +822,29 @@ def main():
         'Senador Canedo', 'Goianira', 'Nerópolis'
     ]
 
-    # Filter and merge
-    metro_cities = goias_cities[goias_cities['NAME_3'].isin(metro_names)]
+    # Select the metropolitan municipalities by index
+    metro_cities = goias_cities.loc[goias_cities.index.intersection(metro_names)]
     print(f"Found {len(metro_cities)} municipalities")
 
-    # Dissolve into single geometry
-    metro_merged = metro_cities.dissolve()
-    metro_geom = metro_merged.geometry.iloc[0]
+    # Bounds and centroid of the metropolitan area from all municipalities
+    # at once: municipalities don't overlap, so the merged bounds are the
+    # extremes and the merged centroid is the area-weighted mean, and no
+    # union of the geometries is needed
+    city_bounds = bounds_many(metro_cities)
+    metro_bounds = {
+        'min_lon': float(city_bounds['minx'].min()),
+        'max_lon': float(city_bounds['maxx'].max()),
+        'min_lat': float(city_bounds['miny'].min()),
+        'max_lat': float(city_bounds['maxy'].max())
+    }
+    areas = shapely.area(metro_cities.geometry.to_numpy())
+    metro_centroid = tuple(
+        np.average(centroids_many(metro_cities), axis=0, weights=areas).tolist()
+    )
 
-    # Get bounds of metropolitan area
-    metro_bounds = get_polygon_bounds(metro_geom)
-    metro_centroid = get_polygon_centroid(metro_geom)
+    print(f"\nBounds:")
+    print(f"  Latitude:  [{metro_bounds['min_lat']:.4f}, {metro_bounds['max_lat']:.4f}]")
+    print(f"  Longitude: [{metro_bounds['min_lon']:.4f}, {metro_bounds['max_lon']:.4f}]")
 
     # Calculate recommended circle radius
     lat_range = metro_bounds['max_lat'] - metro_bounds['min_lat']
@@ -451,6 +873,9 @@ def main():
         output_path=output_dir / "goias_state.pts"
     )
 
+    # To export every state at once (reuses the already loaded shapefile):
+    # export_all_regions(states, 'NAME_1', output_dir / "states")
+
     # ==========================================================================
     # SUMMARY
     # ==========================================================================
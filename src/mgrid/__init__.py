@@ -50,6 +50,8 @@ generate_icosahedral
     Generate quasi-uniform icosahedral mesh.
 save_grid
     Save grid to MPAS NetCDF format.
+save_grid_async
+    Save grid to MPAS NetCDF format in a background thread.
 quick_grid
     Generate and save a grid in one step.
 load_config
@@ -70,81 +72,92 @@ MIT License
 __version__ = "0.1.0"
 __author__ = "MONAN Development Team"
 
-# High-level API functions
-from .api import (
-    Grid,
-    generate_mesh,
-    generate_icosahedral,
-    save_grid,
-    quick_grid,
+import importlib
+
+# Public names and the submodule that defines them. Submodules are only
+# imported when one of their names is first accessed (PEP 562), so e.g.
+# ``from mgrid import quick_grid`` does not load numba, shapely or
+# matplotlib.
+_LAZY_IMPORTS = {
+    # High-level API functions
+    "Grid": "api",
+    "generate_mesh": "api",
+    "generate_icosahedral": "api",
+    "save_grid": "api",
+    "save_grid_async": "api",
+    "quick_grid": "api",
+    # Region classes for custom refinement
+    "Region": "regions",
+    "CircularRegion": "regions",
+    "PolygonRegion": "regions",
+    "compute_cell_width": "regions",
+    "region_from_dict": "regions",
+    "regions_from_config": "regions",
+    # I/O utilities
+    "load_config": "io",
+    "save_config": "io",
+    "validate_config": "io",
+    "convert_to_mpas": "io",
+    "read_mpas_grid": "io",
+    "save_cell_width": "io",
+    # Geometry utilities
+    "haversine_distance": "geometry",
+    "degrees_to_km": "geometry",
+    "km_to_degrees": "geometry",
+    "spherical_to_cartesian": "geometry",
+    "cartesian_to_spherical": "geometry",
+    "icosahedral_resolution": "geometry",
+    "level_for_resolution": "geometry",
+    "EARTH_RADIUS_KM": "geometry",
+    "EARTH_RADIUS_M": "geometry",
+    # Mesh generation
+    "MeshConfig": "mesh",
+    "generate_spherical_mesh": "mesh",
+    "generate_icosahedral_mesh": "mesh",
+    "generate_uniform_mesh": "mesh",
+    "get_mesh_info": "mesh",
+    # Visualization (requires matplotlib when called)
+    "plot_cell_width": "plotting",
+    "plot_region_overview": "plotting",
+    # MPAS Limited-Area integration
+    "generate_pts_file": "limited_area",
+    "generate_pts_from_config": "limited_area",
+    "create_regional_mesh": "limited_area",
+    "create_regional_mesh_python": "limited_area",
+    "plot_region": "limited_area",
+    "partition_mesh": "limited_area",
+    "run_full_pipeline": "limited_area",
+}
+
+# Submodules reachable as attributes (``mgrid.regions.CircularRegion``)
+_SUBMODULES = (
+    "api",
+    "cli",
+    "geometry",
+    "io",
+    "limited_area",
+    "mesh",
+    "plotting",
+    "regions",
 )
 
-# Region classes for custom refinement
-from .regions import (
-    Region,
-    CircularRegion,
-    PolygonRegion,
-    compute_cell_width,
-    region_from_dict,
-    regions_from_config,
-)
 
-# I/O utilities
-from .io import (
-    load_config,
-    save_config,
-    validate_config,
-    convert_to_mpas,
-    read_mpas_grid,
-    save_cell_width,
-)
+def __getattr__(name):
+    """Import public names from their submodule on first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
 
-# Geometry utilities
-from .geometry import (
-    haversine_distance,
-    degrees_to_km,
-    km_to_degrees,
-    spherical_to_cartesian,
-    cartesian_to_spherical,
-    icosahedral_resolution,
-    level_for_resolution,
-    EARTH_RADIUS_KM,
-    EARTH_RADIUS_M,
-)
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-# Mesh generation
-from .mesh import (
-    MeshConfig,
-    generate_spherical_mesh,
-    generate_icosahedral_mesh,
-    generate_uniform_mesh,
-    get_mesh_info,
-)
 
-# Visualization (optional import)
-try:
-    from .plotting import (
-        plot_cell_width,
-        plot_region_overview,
-    )
-except ImportError:
-    # matplotlib not available
-    pass
-
-# MPAS Limited-Area integration (optional)
-try:
-    from .limited_area import (
-        generate_pts_file,
-        generate_pts_from_config,
-        create_regional_mesh,
-        create_regional_mesh_python,
-        plot_region,
-        partition_mesh,
-        run_full_pipeline,
-    )
-except ImportError:
-    # MPAS-Limited-Area not available
-    pass
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_SUBMODULES))
 
 
 __all__ = [
@@ -155,6 +168,7 @@ __all__ = [
     "generate_mesh",
     "generate_icosahedral",
     "save_grid",
+    "save_grid_async",
     "quick_grid",
     # Regions
     "Region",
@@ -18,6 +18,8 @@ Example usage:
     save_grid(mesh, 'my_grid.nc')
 """
 
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from dataclasses import dataclass, field
@@ -71,7 +73,8 @@ class Grid:
         """Mean cell width in km."""
         if self.cell_width.size == 0:
             return 0.0
-        return float(np.mean(self.cell_width))
+        # Accumulate in float64; cell widths may be stored as float32
+        return float(np.mean(self.cell_width, dtype=np.float64))
 
     def summary(self) -> str:
         """Return a summary string of the grid properties."""
@@ -91,6 +94,17 @@ class Grid:
         return "\n".join(lines)
 
 
+def _latlon_mesh(lon: np.ndarray, lat: np.ndarray):
+    """
+    Build the 2D evaluation grid for the cell width function.
+
+    The 2D coordinates are stored as float32 (about 1 m precision), which
+    halves the memory traffic of the cell width computation. The 1D axes
+    passed to JIGSAW remain float64.
+    """
+    return np.meshgrid(lon.astype(np.float32), lat.astype(np.float32))
+
+
 def generate_mesh(
     resolution: Optional[float] = None,
     config: Optional[Union[str, Path, Dict]] = None,
@@ -99,7 +113,8 @@ def generate_mesh(
     grid_density: float = 0.05,
     output_path: Optional[Union[str, Path]] = None,
     generate_jigsaw: bool = True,
-    plot: bool = False
+    plot: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None
 ) -> Grid:
     """
     Generate an MPAS/MONAN mesh with automatic parameter handling.
@@ -128,7 +143,11 @@ def generate_mesh(
     generate_jigsaw : bool, optional
         Whether to run JIGSAW mesh generation (default: True).
     plot : bool, optional
-        Whether to generate diagnostic plots (default: False).
+        Whether to save a diagnostic plot of the cell width next to the
+        output files (default: False). Requires matplotlib.
+    cache_dir : str or Path, optional
+        Directory for caching region distance fields between runs, see
+        :func:`compute_cell_width`. Disabled by default.
 
     Returns
     -------
@@ -154,10 +173,6 @@ def generate_mesh(
     ... )
     >>> grid = generate_mesh(regions=[region], background_resolution=100)
     """
-    from .geometry import create_latlon_grid
-    from .regions import Region, CircularRegion, PolygonRegion
-    from .regions import compute_cell_width, regions_from_config, region_from_dict
-    from .io import load_config, validate_config
     from .mesh import generate_spherical_mesh
 
     # Determine output path
@@ -184,13 +199,16 @@ def generate_mesh(
 
         grid.lat = np.linspace(-90.0, 90.0, nlat)
         grid.lon = np.linspace(-180.0, 180.0, nlon)
-        grid.cell_width = resolution * np.ones((nlat, nlon))
+        grid.cell_width = np.full((nlat, nlon), resolution, dtype=np.float32)
 
         grid.config['mode'] = 'uniform'
         grid.config['resolution'] = resolution
 
     # Mode 2: Configuration file/dict
     elif config is not None:
+        from .regions import compute_cell_width, regions_from_config
+        from .io import load_config, validate_config
+
         if isinstance(config, (str, Path)):
             print(f"\nLoading configuration from: {config}")
             config_dict = load_config(config)
@@ -216,13 +234,14 @@ def generate_mesh(
 
         grid.lat = np.linspace(-90.0, 90.0, nlat)
         grid.lon = np.linspace(-180.0, 180.0, nlon)
-        lons, lats = np.meshgrid(grid.lon, grid.lat)
+        lons, lats = _latlon_mesh(grid.lon, grid.lat)
 
         print(f"\nGrid size: {nlat} x {nlon} points")
         print(f"Background resolution: {background_resolution} km")
 
         grid.cell_width = compute_cell_width(
-            lons, lats, region_list, background_resolution
+            lons, lats, region_list, background_resolution,
+            cache_dir=cache_dir, dtype=np.float32
         )
 
         grid.config['mode'] = 'multi_region'
@@ -231,6 +250,8 @@ def generate_mesh(
 
     # Mode 3: Custom regions
     elif regions is not None:
+        from .regions import compute_cell_width
+
         print(f"\nGenerating grid with {len(regions)} custom regions")
 
         # Find finest resolution
@@ -241,10 +262,11 @@ def generate_mesh(
 
         grid.lat = np.linspace(-90.0, 90.0, nlat)
         grid.lon = np.linspace(-180.0, 180.0, nlon)
-        lons, lats = np.meshgrid(grid.lon, grid.lat)
+        lons, lats = _latlon_mesh(grid.lon, grid.lat)
 
         grid.cell_width = compute_cell_width(
-            lons, lats, regions, background_resolution
+            lons, lats, regions, background_resolution,
+            cache_dir=cache_dir, dtype=np.float32
         )
 
         grid.config['mode'] = 'custom_regions'
@@ -257,14 +279,19 @@ def generate_mesh(
 
     print(f"\nResolution range: {grid.min_resolution:.1f} - {grid.max_resolution:.1f} km")
 
-    # Generate diagnostic plots
+    # Generate diagnostic plots (matplotlib is only imported here)
     if plot:
         from .plotting import plot_cell_width
         plot_file = output_path.parent / f"{output_path.name}_resolution.png"
+
+        # A diagnostic figure does not need every grid point: subsample to
+        # about 1000 rows and save at low dpi without opening a window
+        step = max(1, grid.lat.size // 1000)
         plot_cell_width(
-            grid.cell_width, grid.lon, grid.lat,
+            grid.cell_width[::step, ::step], grid.lon[::step], grid.lat[::step],
             output_file=plot_file,
-            show=True
+            show=False,
+            dpi=72
         )
 
     # Run JIGSAW mesh generation
@@ -282,7 +309,8 @@ def generate_mesh(
 
 def generate_icosahedral(
     level: int = 4,
-    output_path: Optional[Union[str, Path]] = None
+    output_path: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None
 ) -> Grid:
     """
     Generate an icosahedral mesh.
@@ -296,6 +324,9 @@ def generate_icosahedral(
         Level 2: ~500 km, Level 6: ~30 km, Level 8: ~7 km
     output_path : str or Path, optional
         Base path for output files.
+    cache_dir : str or Path, optional
+        Directory for caching icosahedral meshes by level, so repeated
+        calls skip JIGSAW. Disabled by default.
 
     Returns
     -------
@@ -322,7 +353,7 @@ def generate_icosahedral(
     print(f"Level: {level}")
     print(f"Approximate resolution: {resolution:.1f} km")
 
-    mesh_file = generate_icosahedral_mesh(output_path, level)
+    mesh_file = generate_icosahedral_mesh(output_path, level, cache_dir=cache_dir)
 
     grid = Grid()
     grid.mesh_file = mesh_file
@@ -388,6 +419,71 @@ def save_grid(
     return mpas_file
 
 
+# Single background writer shared by save_grid_async calls
+_save_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _shutdown_save_executor() -> None:
+    """Wait for pending save_grid_async writes and stop the writer thread."""
+    global _save_executor
+
+    if _save_executor is not None:
+        _save_executor.shutdown(wait=True)
+        _save_executor = None
+
+
+def save_grid_async(
+    grid: Grid,
+    output_file: Union[str, Path],
+    output_dir: Optional[Union[str, Path]] = None
+) -> Future:
+    """
+    Save a grid to MPAS NetCDF format in a background thread.
+
+    Same as :func:`save_grid`, but returns immediately so the caller can
+    continue while the conversion and NetCDF write run. Writes are
+    executed one at a time, in submission order. Pending writes are
+    completed before the interpreter exits.
+
+    Parameters
+    ----------
+    grid : Grid
+        Grid object from generate_mesh() or generate_icosahedral().
+    output_file : str or Path
+        Output file path (should end in .nc).
+    output_dir : str or Path, optional
+        Directory for intermediate files.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future whose result is the path to the MPAS grid file. Errors
+        raised during the write are re-raised by ``future.result()``.
+
+    Examples
+    --------
+    >>> future = save_grid_async(grid, 'my_mpas_grid.nc')
+    >>> print(grid.summary())
+    >>> mpas_file = future.result()
+    """
+    global _save_executor
+
+    if grid.mesh_file is None:
+        raise ValueError(
+            "Grid has no mesh file. Run generate_mesh() with "
+            "generate_jigsaw=True first."
+        )
+
+    if _save_executor is None:
+        _save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='mgrid-save'
+        )
+        # Finish queued writes before the interpreter exits
+        atexit.register(_shutdown_save_executor)
+
+    return _save_executor.submit(save_grid, grid, output_file, output_dir)
+
+
 def quick_grid(
     resolution: float = 30.0,
     output: str = 'mpas_grid.nc'
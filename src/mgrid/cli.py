@@ -12,16 +12,27 @@ Usage:
 
     # Show grid info
     mgrid info grid.nc
+
+Errors print a full traceback on a terminal; set MGRID_TRACEBACK=1 to get
+it when stderr is redirected (0, false or an empty value disable it).
 """
 
 import argparse
 import json
+import os
 import sys
+import traceback
 from pathlib import Path
 
 
-def main():
-    """Main entry point for the CLI."""
+# Built once per process by _get_parser, so repeated main() calls (tests,
+# notebooks) reuse it; subcommands are added to it as they are needed
+_PARSER = None
+_SUBPARSERS = None
+
+
+def _build_parser():
+    """Build the top-level parser, without any subcommand registered."""
     parser = argparse.ArgumentParser(
         prog='mgrid',
         description='MPAS/MONAN mesh generation tool - Unified workflow',
@@ -57,6 +68,84 @@ Documentation: https://github.com/otaviomf123/mgrid
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
+    # Version
+    parser.add_argument(
+        '--version',
+        action='version',
+        version='%(prog)s 0.1.0'
+    )
+
+    return parser, subparsers
+
+
+def _get_parser(argv):
+    """Return the cached parser with the subcommands ``argv`` needs."""
+    global _PARSER, _SUBPARSERS
+
+    # Only build the subparser that is actually used; all of them are
+    # needed for the top-level help and for usage errors
+    needed = set(_commands_to_build(argv))
+    if _PARSER is None or not needed.issubset(_SUBPARSERS.choices):
+        if _SUBPARSERS is not None:
+            needed.update(_SUBPARSERS.choices)
+        # Rebuild rather than append, so the help always lists the
+        # subcommands in COMMANDS order
+        _PARSER, _SUBPARSERS = _build_parser()
+        for name, build in COMMANDS.items():
+            if name in needed:
+                build(_SUBPARSERS)
+
+    return _PARSER
+
+
+def main():
+    """Main entry point for the CLI."""
+    argv = sys.argv[1:]
+    first = argv[0] if argv else ''
+
+    if first not in COMMANDS and first.endswith('.json'):
+        # A .json file as first argument is a shortcut for 'run': parse it
+        # with the run subparser directly instead of rewriting sys.argv
+        parser = _get_parser(['run'])
+        args = _SUBPARSERS.choices['run'].parse_args(
+            argv, argparse.Namespace(command='run')
+        )
+    else:
+        parser = _get_parser(argv)
+        args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        sys.exit(0)
+
+    try:
+        if args.command == 'run':
+            _cmd_run(args)
+        elif args.command == 'info':
+            _cmd_info(args)
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        if _traceback_enabled():
+            traceback.print_exc()
+        sys.exit(1)
+
+
+def _traceback_enabled():
+    """
+    Whether errors should print a full traceback.
+
+    Tracebacks are shown on a terminal, or when ``MGRID_TRACEBACK`` is set
+    to a true value; batch runs get the one-line error only.
+    """
+    flag = os.environ.get('MGRID_TRACEBACK', '').strip().lower()
+    return sys.stderr.isatty() or flag not in ('', '0', 'false', 'no', 'off')
+
+
+def _build_run_parser(subparsers):
+    """Register the 'run' subcommand."""
     # Run command (default when positional config is given)
     run_parser = subparsers.add_parser(
         'run',
@@ -83,8 +172,11 @@ Documentation: https://github.com/otaviomf123/mgrid
         action='store_true',
         help='Skip plot generation'
     )
+    return run_parser
 
-    # Info command
+
+def _build_info_parser(subparsers):
+    """Register the 'info' subcommand."""
     info_parser = subparsers.add_parser(
         'info',
         help='Show information about an MPAS grid file'
@@ -94,57 +186,52 @@ Documentation: https://github.com/otaviomf123/mgrid
         type=str,
         help='MPAS grid file (.nc)'
     )
+    return info_parser
 
-    # Version
-    parser.add_argument(
-        '--version',
-        action='version',
-        version='%(prog)s 0.1.0'
-    )
 
-    # Handle case where first argument is a .json file (shortcut for 'run')
-    # Check BEFORE parsing if first arg is a .json file
-    if len(sys.argv) > 1 and sys.argv[1].endswith('.json'):
-        # Insert 'run' command before the json file
-        sys.argv.insert(1, 'run')
+# Subcommand builders, in the order they are listed in the help
+COMMANDS = {
+    'run': _build_run_parser,
+    'info': _build_info_parser,
+}
 
-    args = parser.parse_args()
 
-    if args.command is None:
-        parser.print_help()
-        sys.exit(0)
+def _commands_to_build(argv):
+    """
+    Return the subcommands that need to be registered to parse ``argv``.
 
-    try:
-        if args.command == 'run':
-            _cmd_run(args)
-        elif args.command == 'info':
-            _cmd_info(args)
-    except KeyboardInterrupt:
-        print("\nInterrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\nError: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    This is the subcommand named by the first non-flag token, or all of
+    them if there is none or the top-level help is requested first.
+    """
+    for token in argv:
+        if token in ('-h', '--help'):
+            break
+        if not token.startswith('-'):
+            if token in COMMANDS:
+                return [token]
+            break
+    return list(COMMANDS)
 
 
 def _cmd_run(args):
     """Handle unified run command."""
-    from .api import generate_mesh
-    from .io import load_config, save_config
-    from .limited_area import (
-        generate_pts_file,
-        create_regional_mesh_python,
-        partition_mesh,
-    )
-
+    # The scientific stack is imported next to its first use so that
+    # early errors never pay for it
     config_path = Path(args.config)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load configuration
-    config = load_config(config_path)
+    # NumPy comes with the io module anyway
+    import numpy as np
+
+    # Load configuration. A regional cut from an existing static file only
+    # needs a few keys, so large region lists are not materialized then
+    if args.static_file and not args.jigsaw:
+        from .io import load_config_lazy
+        config = load_config_lazy(config_path)
+    else:
+        from .io import load_config
+        config = load_config(config_path)
 
     print("\n" + "=" * 70)
     print("mgrid: MPAS/MONAN Mesh Generation Pipeline")
@@ -173,6 +260,8 @@ def _cmd_run(args):
         print("STEP 1: Generate mesh with JIGSAW")
         print("-" * 70)
 
+        from .api import generate_mesh
+
         mesh_name = config.get('name', 'mesh')
         output_path = output_dir / mesh_name
 
@@ -210,6 +299,8 @@ def _cmd_run(args):
         if not static_path.exists():
             raise FileNotFoundError(f"Static file not found: {static_path}")
 
+        from .limited_area import generate_pts_file, create_regional_mesh_python
+
         print("\n" + "-" * 70)
         print("STEP 2: Cut regional mesh from static file")
         print("-" * 70)
@@ -232,12 +323,10 @@ def _cmd_run(args):
                         # Calculate centroid
                         polygon = r.get('polygon', [])
                         if polygon:
-                            lats = [p[0] for p in polygon]
-                            lons = [p[1] for p in polygon]
-                            regional_cut['inside_point'] = [
-                                sum(lats) / len(lats),
-                                sum(lons) / len(lons)
-                            ]
+                            vertices = np.asarray(polygon, dtype=np.float64)
+                            regional_cut['inside_point'] = (
+                                vertices.mean(axis=0).tolist()
+                            )
                         break
                     elif r.get('type') == 'circle':
                         regional_cut = {
@@ -268,14 +357,13 @@ def _cmd_run(args):
                 radius=regional_cut.get('radius'),
             )
         else:
-            polygon = regional_cut.get('polygon', [])
-            polygon_tuples = [(p[0], p[1]) for p in polygon]
+            # generate_pts_file takes the [lat, lon] pairs as they are
             pts_path = generate_pts_file(
                 output_path=pts_file,
                 name=mesh_name,
                 region_type='custom',
                 inside_point=tuple(inside_point),
-                polygon=polygon_tuples,
+                polygon=regional_cut.get('polygon', []),
             )
 
         print(f"Points file: {pts_path}")
@@ -303,6 +391,8 @@ def _cmd_run(args):
             print(f"STEP 3: Partition mesh for MPI ({partitions} processes)")
             print("-" * 70)
 
+            from .limited_area import partition_mesh
+
             if isinstance(partitions, int):
                 partitions = [partitions]
 
@@ -350,6 +440,8 @@ def _cmd_run(args):
 
 def _cmd_info(args):
     """Handle info command."""
+    import heapq
+
     from .io import read_mpas_grid
 
     print(f"\n{'=' * 60}")
@@ -365,11 +457,14 @@ def _cmd_info(args):
     if 'sphere_radius' in info:
         print(f"Sphere radius: {info['sphere_radius']}")
 
-    print(f"\nVariables: {len(info['variables'])}")
-    for var in sorted(info['variables'])[:20]:
+    # Only the first 20 names (alphabetically) are shown: a bounded heap
+    # avoids sorting the whole variable list
+    n_variables = len(info['variables'])
+    print(f"\nVariables: {n_variables}")
+    for var in heapq.nsmallest(20, info['variables']):
         print(f"  - {var}")
-    if len(info['variables']) > 20:
-        print(f"  ... and {len(info['variables']) - 20} more")
+    if n_variables > 20:
+        print(f"  ... and {n_variables - 20} more")
 
 
 if __name__ == '__main__':
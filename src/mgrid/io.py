@@ -6,11 +6,24 @@ including JIGSAW mesh files, NetCDF, and MPAS-specific formats.
 """
 
 import json
+import math
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    # orjson not available, configurations use the standard json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson not available, load_config_lazy parses the whole file
+    ijson = None
+
 
 def load_config(config_file: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -35,6 +48,14 @@ def load_config(config_file: Union[str, Path]) -> Dict[str, Any]:
         If configuration file does not exist.
     json.JSONDecodeError
         If file is not valid JSON.
+    ValueError
+        If the file contains NaN or Infinity, which are not valid JSON.
+
+    Notes
+    -----
+    The file is parsed with orjson when it is installed, which is
+    noticeably faster when many configurations are processed. Both
+    parsers read UTF-8 and reject non-finite numbers.
 
     Examples
     --------
@@ -47,12 +68,151 @@ def load_config(config_file: Union[str, Path]) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    if orjson is not None:
+        return orjson.loads(config_path.read_bytes())
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f, parse_constant=_reject_constant)
+
+    return config
+
+
+def _reject_constant(name: str):
+    """parse_constant hook: reject NaN and Infinity like orjson does."""
+    raise ValueError(f"Non-finite number {name} is not valid JSON")
+
+
+def _check_finite(value: Any) -> None:
+    """Raise ValueError if value contains a NaN or infinite number."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _check_finite(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _check_finite(item)
+    elif isinstance(value, np.ndarray):
+        if value.dtype.kind in 'fc' and not np.isfinite(value).all():
+            raise ValueError("Non-finite numbers cannot be saved as JSON")
+    elif isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        raise ValueError("Non-finite numbers cannot be saved as JSON")
+
+
+# Top-level keys the regional cut (--static-file) needs
+REGIONAL_CUT_KEYS = (
+    'name', 'description', 'output_dir', 'static_file',
+    'regional_cut', 'partitions', 'regions',
+)
+
+
+def load_config_lazy(
+    config_file: Union[str, Path],
+    need: Tuple[str, ...] = REGIONAL_CUT_KEYS,
+) -> Dict[str, Any]:
+    """
+    Load only selected top-level keys from a JSON configuration file.
+
+    With ijson installed the file is streamed and the values of other keys
+    are skipped without being built. ``regions`` is reduced to what is
+    needed to infer a regional cut: its circle entries up to and including
+    the first polygon entry, after which the rest of the list is skipped.
+
+    Parameters
+    ----------
+    config_file : str or Path
+        Path to the JSON configuration file.
+    need : tuple of str, optional
+        Top-level keys to load.
+
+    Returns
+    -------
+    config : dict
+        Configuration dictionary with the requested keys that are present.
+
+    Raises
+    ------
+    FileNotFoundError
+        If configuration file does not exist.
+
+    Notes
+    -----
+    Without ijson this falls back to :func:`load_config` and keeps the
+    full ``regions`` list.
+    """
+    config_path = Path(config_file)
+
+    if ijson is None:
+        config = load_config(config_path)
+        return {key: config[key] for key in need if key in config}
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    config = {}
+    with open(config_path, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix != '' or event != 'map_key':
+                continue
+            if value == 'regions' and 'regions' in need:
+                config['regions'] = _stream_cut_regions(events)
+            elif value in need:
+                config[value] = _stream_value(events, ijson.ObjectBuilder())
+            else:
+                _stream_value(events, None)
 
     return config
 
 
+def _stream_value(events, builder, event=None, value=None):
+    """
+    Consume one JSON value from an ijson event stream.
+
+    The value is built with ``builder`` (an ``ijson.ObjectBuilder``) or
+    skipped if it is None. ``event``/``value`` pass the value's first
+    event when the caller has already read it.
+    """
+    if event is None:
+        _, event, value = next(events)
+
+    depth = 0
+    while True:
+        if builder is not None:
+            builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            break
+        _, event, value = next(events)
+
+    return None if builder is None else builder.value
+
+
+def _stream_cut_regions(events):
+    """Build the regions usable for a regional cut from a streamed list."""
+    _, event, value = next(events)
+    if event != 'start_array':
+        return _stream_value(events, ijson.ObjectBuilder(), event, value)
+
+    regions = []
+    for _, event, value in events:
+        if event == 'end_array':
+            break
+        region = _stream_value(events, ijson.ObjectBuilder(), event, value)
+        if not isinstance(region, dict):
+            continue
+        if region.get('type') == 'circle':
+            regions.append(region)
+        elif region.get('type') == 'polygon':
+            # The first polygon decides the cut: skip the rest of the list
+            regions.append(region)
+            _stream_value(events, None, 'start_array', None)
+            break
+
+    return regions
+
+
 def save_config(config: Dict[str, Any], output_file: Union[str, Path]) -> Path:
     """
     Save grid configuration to a JSON file.
@@ -68,11 +228,29 @@ def save_config(config: Dict[str, Any], output_file: Union[str, Path]) -> Path:
     -------
     output_path : Path
         Path to saved configuration file.
+
+    Raises
+    ------
+    ValueError
+        If the configuration contains NaN or infinite numbers.
     """
     output_path = Path(output_file)
 
-    with open(output_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        # orjson would silently write non-finite floats as null
+        _check_finite(config)
+        output_path.write_bytes(orjson.dumps(
+            config,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS
+            )
+        ))
+        return output_path
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False, allow_nan=False)
 
     return output_path
 
@@ -20,6 +20,8 @@ import subprocess
 import sys
 import os
 
+import numpy as np
+
 
 def generate_pts_file(
     output_path: Union[str, Path],
@@ -99,9 +101,17 @@ def generate_pts_file(
     if region_type.lower() == 'custom':
         if polygon is None:
             raise ValueError("polygon is required for 'custom' region type")
-        # Add polygon vertices
-        for lat, lon in polygon:
-            lines.append(f"{lat}, {lon}")
+        # Add polygon vertices: format every row with a single bound method
+        # instead of unpacking and building an f-string per vertex. Values
+        # are written as given (arrays as Python numbers via tolist)
+        rows = polygon.tolist() if isinstance(polygon, np.ndarray) else list(polygon)
+        try:
+            malformed = any(len(row) != 2 for row in rows)
+        except TypeError:
+            malformed = True
+        if malformed:
+            raise ValueError("polygon must be a sequence of (lat, lon) pairs")
+        lines.extend(map("{0[0]}, {0[1]}".format, rows))
 
     elif region_type.lower() == 'circle':
         if radius is None:
@@ -179,12 +189,7 @@ def generate_pts_from_config(
         raise ValueError("No polygon vertices found in outer region")
 
     # Calculate centroid as inside point
-    lats = [p[0] for p in polygon]
-    lons = [p[1] for p in polygon]
-    centroid = (sum(lats) / len(lats), sum(lons) / len(lons))
-
-    # Convert to list of tuples
-    polygon_tuples = [(p[0], p[1]) for p in polygon]
+    centroid = tuple(np.asarray(polygon, dtype=np.float64).mean(axis=0).tolist())
 
     # Determine name
     if region_name is None:
@@ -195,7 +200,7 @@ def generate_pts_from_config(
         name=region_name,
         region_type='custom',
         inside_point=centroid,
-        polygon=polygon_tuples,
+        polygon=polygon,
     )
 
 
@@ -6,7 +6,10 @@ using JIGSAW, including uniform resolution, icosahedral, and variable-density
 Voronoi meshes.
 """
 
+import os
+import shutil
 import subprocess
+import tempfile
 import numpy as np
 from pathlib import Path
 from typing import Tuple, Optional, Union
@@ -135,7 +138,8 @@ def generate_spherical_mesh(
     hmat.mshID = 'ELLIPSOID-GRID'
     hmat.xgrid = np.radians(lon)
     hmat.ygrid = np.radians(lat)
-    hmat.value = cell_width
+    # The sizing function may be stored as float32; JIGSAW expects reals
+    hmat.value = np.asarray(cell_width, dtype=hmat.REALS_t)
     jig.savemsh(opts.hfun_file, hmat)
 
     # Define geometry (ellipsoidal Earth)
@@ -180,7 +184,8 @@ def generate_spherical_mesh(
 
 def generate_icosahedral_mesh(
     output_path: Union[str, Path],
-    level: int = 4
+    level: int = 4,
+    cache_dir: Optional[Union[str, Path]] = None
 ) -> Path:
     """
     Generate an icosahedral mesh using JIGSAW.
@@ -200,6 +205,11 @@ def generate_icosahedral_mesh(
         - Level 4: ~10,000 cells (~120 km)
         - Level 6: ~160,000 cells (~30 km)
         - Level 8: ~2,500,000 cells (~7 km)
+    cache_dir : str or Path, optional
+        Directory for caching generated meshes by level (e.g.
+        ``~/.cache/mgrid``). When a mesh for the level is cached it is
+        copied to the output path and JIGSAW is not run. Disabled by
+        default.
 
     Returns
     -------
@@ -213,18 +223,31 @@ def generate_icosahedral_mesh(
     ValueError
         If level is outside valid range.
     """
+    if level < 0 or level > 12:
+        raise ValueError(f"Level must be between 0 and 12, got {level}")
+
+    output_path = Path(output_path)
+    mesh_file = Path(str(output_path) + '-MESH.msh')
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = cache_dir / f'icosahedron_level{level}.msh'
+
+        if cache_file.exists():
+            print(f"Using cached icosahedral mesh (level {level}): {cache_file}")
+            shutil.copyfile(cache_file, mesh_file)
+            return mesh_file
+
     if not _check_jigsawpy_available():
         raise ImportError(
             "jigsawpy is required for mesh generation. "
             "Install with: conda install -c conda-forge jigsawpy"
         )
 
-    if level < 0 or level > 12:
-        raise ValueError(f"Level must be between 0 and 12, got {level}")
-
     import jigsawpy as jig
 
-    output_path = Path(output_path)
     basename = str(output_path)
 
     # Setup JIGSAW
@@ -234,7 +257,7 @@ def generate_icosahedral_mesh(
 
     opts.geom_file = basename + '.msh'
     opts.jcfg_file = basename + '.jig'
-    opts.mesh_file = basename + '-MESH.msh'
+    opts.mesh_file = str(mesh_file)
 
     # Unit sphere geometry
     geom.mshID = "ellipsoid-mesh"
@@ -261,7 +284,21 @@ def generate_icosahedral_mesh(
     print("Icosahedral mesh generated successfully!")
     print("=" * 60 + "\n")
 
-    return Path(opts.mesh_file)
+    if cache_file is not None:
+        # Copy to a temporary file and move it into place, so an
+        # interrupted copy never leaves a truncated mesh as a cache hit
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_file.parent, prefix=f'{cache_file.name}.', suffix='.tmp'
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(mesh_file, tmp_name)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    return mesh_file
 
 
 def generate_uniform_mesh(
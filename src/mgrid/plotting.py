@@ -20,7 +20,8 @@ def plot_cell_width(
     output_file: Optional[Union[str, Path]] = None,
     show: bool = True,
     figsize: Tuple[int, int] = (14, 6),
-    cmap: str = 'viridis'
+    cmap: str = 'viridis',
+    dpi: int = 150
 ) -> None:
     """
     Create diagnostic plots for cell width distribution.
@@ -49,6 +50,8 @@ def plot_cell_width(
         Figure size in inches (width, height).
     cmap : str, optional
         Colormap for cell width display.
+    dpi : int, optional
+        Resolution of the saved figure (default: 150).
 
     Notes
     -----
@@ -108,7 +111,7 @@ def plot_cell_width(
 
     if output_file is not None:
         output_path = Path(output_file)
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
+        plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
         print(f"Figure saved to: {output_path}")
 
     if show:
@@ -159,7 +162,8 @@ def plot_region_overview(
     lat_bounds: Tuple[float, float] = (-90, 90),
     lon_bounds: Tuple[float, float] = (-180, 180),
     output_file: Optional[Union[str, Path]] = None,
-    show: bool = True
+    show: bool = True,
+    dpi: int = 150
 ) -> None:
     """
     Create an overview plot of refinement regions.
@@ -178,6 +182,8 @@ def plot_region_overview(
         Path to save figure.
     show : bool, optional
         Whether to display the figure.
+    dpi : int, optional
+        Resolution of the saved figure (default: 150).
     """
     try:
         import matplotlib.pyplot as plt
@@ -256,7 +262,7 @@ def plot_region_overview(
     plt.tight_layout()
 
     if output_file is not None:
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
         print(f"Figure saved to: {output_file}")
 
     if show:
@@ -6,13 +6,25 @@ different mesh resolutions, including circular and polygonal areas
 with smooth transition zones.
 """
 
+import hashlib
+import json
+import math
+import os
+import tempfile
 import numpy as np
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Tuple, Optional, Union
 
 from .geometry import haversine_distance, EARTH_RADIUS_KM
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba not available, compute_cell_width uses the NumPy path
+    njit = None
+
 
 @dataclass
 class Region(ABC):
@@ -122,22 +134,31 @@ class PolygonRegion(Region):
 
     Attributes
     ----------
-    vertices : list
-        List of (latitude, longitude) tuples defining the polygon vertices.
-        The polygon is automatically closed.
+    vertices : list or ndarray
+        (latitude, longitude) pairs defining the polygon vertices, as a
+        list of tuples or an (N, 2) array. The polygon is automatically
+        closed.
     """
-    vertices: List[Tuple[float, float]] = field(default_factory=list)
+    vertices: Union[List[Tuple[float, float]], np.ndarray] = field(
+        default_factory=list
+    )
     _polygon: object = field(default=None, repr=False, init=False)
 
     def __post_init__(self):
         """Initialize shapely polygon for geometric operations."""
         try:
             from shapely.geometry import Polygon
-            # Convert (lat, lon) to (lon, lat) for shapely
-            coords = [(v[1], v[0]) for v in self.vertices]
-            self._polygon = Polygon(coords)
         except ImportError:
             self._polygon = None
+            return
+
+        if len(self.vertices) == 0:
+            self._polygon = Polygon()
+            return
+
+        # Convert (lat, lon) to (lon, lat) for shapely
+        coords = np.asarray(self.vertices, dtype=np.float64)[:, ::-1]
+        self._polygon = Polygon(coords)
 
     def contains(
         self,
@@ -151,19 +172,11 @@ class PolygonRegion(Region):
                 "Install with: pip install shapely"
             )
 
-        from shapely.geometry import Point
-
-        original_shape = lons.shape
-        lon_flat = lons.flatten()
-        lat_flat = lats.flatten()
-
-        inside = np.zeros(len(lon_flat), dtype=bool)
-
-        for i, (lo, la) in enumerate(zip(lon_flat, lat_flat)):
-            point = Point(lo, la)
-            inside[i] = self._polygon.contains(point)
+        from shapely import contains_xy, prepare
 
-        return inside.reshape(original_shape)
+        # Prepared geometries speed up repeated predicate evaluation
+        prepare(self._polygon)
+        return contains_xy(self._polygon, lons, lats)
 
     def distance_to_boundary(
         self,
@@ -182,37 +195,468 @@ class PolygonRegion(Region):
                 "Install with: pip install shapely"
             )
 
-        from shapely.geometry import Point
+        import shapely
 
-        original_shape = lons.shape
-        lon_flat = lons.flatten()
-        lat_flat = lats.flatten()
+        inside = self.contains(lons, lats)
 
-        distances = np.zeros(len(lon_flat))
-        inside = self.contains(lons, lats).flatten()
+        # One vectorized GEOS call for all points
+        points = shapely.points(lons, lats)
+        dist_deg = shapely.distance(self._polygon.boundary, points)
 
         # Approximate conversion: 1 degree ~ 111 km
-        deg_to_km = 111.0
+        distances = dist_deg * 111.0
 
-        for i, (lo, la) in enumerate(zip(lon_flat, lat_flat)):
-            point = Point(lo, la)
-            dist_deg = point.distance(self._polygon.boundary)
-            dist_km = dist_deg * deg_to_km
+        # Negative inside, positive outside
+        return np.where(inside, -distances, distances)
 
-            # Negative inside, positive outside
-            if inside[i]:
-                distances[i] = -dist_km
+
+def _influence_bounds(region: Region) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Bounds outside which a region cannot change the cell width.
+
+    Returns ``(lat_min, lat_max, lon_center, lon_half_width)`` in degrees,
+    or None if the region type has no known bounds. A point is within
+    reach if its latitude is in ``[lat_min, lat_max]`` and its longitude
+    is within ``lon_half_width`` of ``lon_center`` (measured modulo 360
+    degrees for circles, which use great-circle distances).
+    """
+    reach = max(region.transition_width, 0.0)
+
+    if isinstance(region, CircularRegion):
+        lat0, lon0 = region.center
+        # Angular radius of the spherical cap of influence, with a small
+        # safety margin for rounding in the distance computation
+        alpha = (region.radius + reach) / EARTH_RADIUS_KM * (1.0 + 1e-9) + 1e-12
+        dlat = math.degrees(alpha)
+        if math.degrees(alpha) + abs(lat0) >= 90.0:
+            # The cap contains a pole: all longitudes are reachable
+            dlon = math.inf
+        else:
+            dlon = math.degrees(
+                math.asin(math.sin(alpha) / math.cos(math.radians(lat0)))
+            )
+        return (lat0 - dlat, lat0 + dlat, float(lon0), dlon)
+
+    if isinstance(region, PolygonRegion) and len(region.vertices) >= 3:
+        vertices = np.asarray(region.vertices, dtype=np.float64)
+        # Polygon distances are planar in degrees (1 degree ~ 111 km)
+        margin = reach / 111.0 * (1.0 + 1e-9) + 1e-12
+        lat_min = vertices[:, 0].min() - margin
+        lat_max = vertices[:, 0].max() + margin
+        lon_min = vertices[:, 1].min() - margin
+        lon_max = vertices[:, 1].max() + margin
+        return (
+            lat_min, lat_max,
+            0.5 * (lon_min + lon_max), 0.5 * (lon_max - lon_min)
+        )
+
+    return None
+
+
+def _within_bounds(
+    region: Region,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    bounds: Tuple[float, float, float, float]
+) -> np.ndarray:
+    """Mask of the points within reach of a region (see _influence_bounds)."""
+    lat_min, lat_max, lon_center, lon_half_width = bounds
+    dlon = lons - lon_center
+    if isinstance(region, CircularRegion):
+        dlon = (dlon + 180.0) % 360.0 - 180.0
+    return (lats >= lat_min) & (lats <= lat_max) & (np.abs(dlon) <= lon_half_width)
+
+
+# ============================================================================
+# Compiled cell width kernels (optional, requires numba)
+# ============================================================================
+
+# Region type codes used by RegionBatch
+_KIND_CIRCLE = 0
+_KIND_POLYGON = 1
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _blend_point(cell_width, dist, inside, resolution, transition_width):
+        """Apply one region to a single cell width value."""
+        if inside:
+            return min(cell_width, resolution)
+        if transition_width > 0 and 0.0 < dist <= transition_width:
+            fraction = dist / transition_width
+            return min(cell_width, resolution + fraction * (cell_width - resolution))
+        return cell_width
+
+    @njit(cache=True)
+    def _polygon_signed_distance(px, py, ex0, ey0, ex1, ey1, start, stop):
+        """
+        Planar distance (degrees) from a point to a closed ring, and
+        whether the point is strictly inside it (crossing-number test).
+
+        The ring is given by the edges ``start:stop`` of the edge arrays.
+        The point-segment distance follows GEOS so that points on the
+        boundary get exactly zero distance, as with shapely.
+        """
+        min_dist = np.inf
+        crossings = False
+        for k in range(start, stop):
+            x0 = ex0[k]
+            y0 = ey0[k]
+            x1 = ex1[k]
+            y1 = ey1[k]
+            dx = x1 - x0
+            dy = y1 - y0
+
+            # Distance to segment
+            seg_len_sq = dx * dx + dy * dy
+            if seg_len_sq == 0.0:
+                dist = math.hypot(px - x0, py - y0)
             else:
-                distances[i] = dist_km
+                r = ((px - x0) * dx + (py - y0) * dy) / seg_len_sq
+                if r <= 0.0:
+                    dist = math.hypot(px - x0, py - y0)
+                elif r >= 1.0:
+                    dist = math.hypot(px - x1, py - y1)
+                else:
+                    s = ((y0 - py) * dx - (x0 - px) * dy) / seg_len_sq
+                    dist = abs(s) * math.sqrt(seg_len_sq)
+            if dist < min_dist:
+                min_dist = dist
+
+            # Crossing number
+            if (y0 > py) != (y1 > py):
+                if px < x0 + (py - y0) * dx / dy:
+                    crossings = not crossings
+
+        # Points on the boundary are not inside (same as shapely contains)
+        return min_dist, crossings and min_dist > 0.0
+
+    @njit(fastmath=True, cache=True)
+    def _circle_signed_distance(lat, lon, cos_lat, lat0, lon0, cos_lat0, radius):
+        """Haversine distance (km) to a circle boundary, inputs in radians."""
+        sin_dlat = math.sin(0.5 * (lat - lat0))
+        sin_dlon = math.sin(0.5 * (lon - lon0))
+        a = sin_dlat * sin_dlat + cos_lat * cos_lat0 * sin_dlon * sin_dlon
+        return 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)) - radius
+
+    @njit(parallel=True, cache=True)
+    def _batch_cell_width_kernel(
+        lons, lats, kinds, resolutions, transition_widths,
+        centers_rad, cos_center_lats, radii, ex0, ey0, ex1, ey1, starts,
+        bounds, cell_width
+    ):
+        """
+        Apply every region of a RegionBatch to a flat cell width array.
+
+        Points are distributed over threads; for each point the regions
+        are applied in batch order, reading the parameter arrays
+        contiguously. Regions whose bounds exclude the point are skipped
+        before any distance is computed.
+        """
+        n_regions = kinds.size
+        for i in prange(cell_width.size):
+            # Coordinates may be stored as float32; compute in float64
+            lon = np.float64(lons[i])
+            lat = np.float64(lats[i])
+            lon_rad = math.radians(lon)
+            lat_rad = math.radians(lat)
+            cos_lat = math.cos(lat_rad)
+            cw = cell_width[i]
+            for r in range(n_regions):
+                # Skip regions that cannot reach this point
+                if lat < bounds[r, 0] or lat > bounds[r, 1]:
+                    continue
+                dlon = lon - bounds[r, 2]
+                if kinds[r] == _KIND_CIRCLE:
+                    dlon = (dlon + 180.0) % 360.0 - 180.0
+                if abs(dlon) > bounds[r, 3]:
+                    continue
+
+                if kinds[r] == _KIND_CIRCLE:
+                    dist = _circle_signed_distance(
+                        lat_rad, lon_rad, cos_lat, centers_rad[r, 0],
+                        centers_rad[r, 1], cos_center_lats[r], radii[r]
+                    )
+                    inside = dist <= 0.0
+                else:
+                    dist_deg, inside = _polygon_signed_distance(
+                        lon, lat, ex0, ey0, ex1, ey1, starts[r], starts[r + 1]
+                    )
+                    # Approximate conversion: 1 degree ~ 111 km
+                    dist = -dist_deg * 111.0 if inside else dist_deg * 111.0
+                cw = _blend_point(
+                    cw, dist, inside, resolutions[r], transition_widths[r]
+                )
+            cell_width[i] = cw
+
+
+class RegionBatch:
+    """
+    Struct-of-arrays view of a list of regions for the compiled kernel.
+
+    Regions keep the order in which they are given. Circle parameters
+    are stored per region (unused entries for polygons are zero) and the
+    polygon vertices are concatenated in CSR layout: the vertices of
+    region ``r`` are ``verts[starts[r]:starts[r + 1]]``, as (lon, lat).
+    The closed ring edges are precomputed with the same offsets as
+    separate contiguous endpoint arrays, so the kernel reads them
+    sequentially without wrapping indices.
 
-        return distances.reshape(original_shape)
+    Parameters
+    ----------
+    regions : list of Region
+        Circular and polygon regions, in the order they are applied.
+
+    Attributes
+    ----------
+    kinds : ndarray
+        Region type codes (0 circle, 1 polygon), shape (R,).
+    resolutions, transition_widths : ndarray
+        Region resolution and transition width in km, shape (R,).
+    centers : ndarray
+        Circle centers as (lat, lon) in degrees, shape (R, 2).
+    radii : ndarray
+        Circle radii in km, shape (R,).
+    verts : ndarray
+        Concatenated polygon vertices as (lon, lat), shape (V, 2).
+    starts : ndarray
+        Offsets of each region into ``verts`` and the edge arrays,
+        shape (R + 1,).
+    ex0, ey0, ex1, ey1 : ndarray
+        Edge start and end coordinates (lon, lat), shape (V,).
+    bounds : ndarray
+        Reach of each region as (lat_min, lat_max, lon_center,
+        lon_half_width) in degrees, shape (R, 4).
+    """
+
+    def __init__(self, regions: List[Region]):
+        unsupported = [r.name for r in regions if not self.supports(r)]
+        if unsupported:
+            raise ValueError(
+                f"Regions not supported by RegionBatch: {unsupported}"
+            )
+
+        n = len(regions)
+        self.kinds = np.empty(n, dtype=np.int8)
+        self.resolutions = np.empty(n, dtype=np.float64)
+        self.transition_widths = np.empty(n, dtype=np.float64)
+        self.centers = np.zeros((n, 2), dtype=np.float64)
+        self.radii = np.zeros(n, dtype=np.float64)
+        self.starts = np.zeros(n + 1, dtype=np.int32)
+        self.bounds = np.empty((n, 4), dtype=np.float64)
+
+        rings = []
+        for i, region in enumerate(regions):
+            self.resolutions[i] = region.resolution
+            self.transition_widths[i] = region.transition_width
+            self.bounds[i] = _influence_bounds(region)
+
+            if isinstance(region, CircularRegion):
+                self.kinds[i] = _KIND_CIRCLE
+                self.centers[i] = region.center
+                self.radii[i] = region.radius
+                n_verts = 0
+            else:
+                self.kinds[i] = _KIND_POLYGON
+                # Convert (lat, lon) to (lon, lat), as for shapely
+                ring = np.asarray(region.vertices, dtype=np.float64)[:, ::-1]
+                rings.append(ring)
+                n_verts = len(ring)
+
+            self.starts[i + 1] = self.starts[i] + n_verts
+
+        if rings:
+            self.verts = np.ascontiguousarray(np.concatenate(rings))
+            # Edge k of each ring runs from vertex k to vertex k + 1 (closed)
+            ends = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+        else:
+            self.verts = np.empty((0, 2), dtype=np.float64)
+            ends = self.verts
+
+        self.ex0 = np.ascontiguousarray(self.verts[:, 0])
+        self.ey0 = np.ascontiguousarray(self.verts[:, 1])
+        self.ex1 = np.ascontiguousarray(ends[:, 0])
+        self.ey1 = np.ascontiguousarray(ends[:, 1])
+
+    def __len__(self) -> int:
+        return self.kinds.size
+
+    @staticmethod
+    def supports(region: Region) -> bool:
+        """Whether a region can be evaluated by the compiled kernel."""
+        if isinstance(region, CircularRegion):
+            return True
+        return isinstance(region, PolygonRegion) and len(region.vertices) >= 3
+
+    def apply(
+        self,
+        lons: np.ndarray,
+        lats: np.ndarray,
+        cell_width: np.ndarray
+    ) -> None:
+        """
+        Apply all regions to flat cell width array in place.
+
+        Parameters
+        ----------
+        lons, lats : ndarray
+            1D contiguous float32 or float64 arrays of point coordinates.
+        cell_width : ndarray
+            1D float64 array updated in place.
+        """
+        if njit is None:
+            raise ImportError(
+                "numba is required for RegionBatch.apply. "
+                "Install with: pip install numba"
+            )
+
+        centers_rad = np.radians(self.centers)
+        _batch_cell_width_kernel(
+            lons, lats, self.kinds, self.resolutions, self.transition_widths,
+            centers_rad, np.cos(centers_rad[:, 0]), self.radii,
+            self.ex0, self.ey0, self.ex1, self.ey1, self.starts, self.bounds,
+            cell_width
+        )
+
+
+# ============================================================================
+# On-disk cache of region distance fields
+# ============================================================================
+
+def _grid_digest(lons: np.ndarray, lats: np.ndarray) -> bytes:
+    """Hash the evaluation grid so cached fields are tied to it."""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in (lons, lats):
+        arr = np.ascontiguousarray(arr)
+        h.update(f'{arr.dtype.str}{arr.shape}'.encode())
+        # Hash the buffer as it is, without a converted copy
+        h.update(memoryview(arr).cast('B'))
+    return h.digest()
+
+
+def _region_cache_key(region: Region, grid_digest: bytes) -> Optional[str]:
+    """
+    Build the cache key of a region's distance field.
+
+    Only the geometry enters the key, so changing the resolution or the
+    transition width of a region reuses its cached field. Returns None
+    for region types that cannot be cached.
+    """
+    if isinstance(region, CircularRegion):
+        geometry = {
+            'type': 'circle',
+            'center': [float(c) for c in region.center],
+            'radius': float(region.radius),
+        }
+    elif isinstance(region, PolygonRegion):
+        geometry = {
+            'type': 'polygon',
+            'vertices': [[float(c) for c in v] for v in region.vertices],
+        }
+    else:
+        return None
+
+    h = hashlib.blake2b(grid_digest, digest_size=20)
+    h.update(json.dumps(geometry, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _cached_distance_to_boundary(
+    region: Region,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    cache_dir: Path,
+    grid_digest: bytes
+) -> np.ndarray:
+    """Load a region's distance field from the cache, computing it if missing."""
+    key = _region_cache_key(region, grid_digest)
+
+    # Distances are computed in float64 even for float32 grids
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    if key is None:
+        return region.distance_to_boundary(lons, lats)
+
+    cache_file = cache_dir / f'{key}.npy'
+    if cache_file.exists():
+        return np.load(cache_file, mmap_mode='r')
+
+    dist = region.distance_to_boundary(lons, lats).astype(np.float32)
+
+    # Write to a uniquely named temporary file first so concurrent runs
+    # never read a partially written field or clobber each other's writes
+    with tempfile.NamedTemporaryFile(
+        dir=cache_dir, prefix=f'{key}.', suffix='.tmp', delete=False
+    ) as f:
+        tmp_name = f.name
+        try:
+            np.save(f, dist)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_name)
+            raise
+    os.replace(tmp_name, cache_file)
+
+    return dist
+
+
+def _blend_region(
+    cell_width: np.ndarray,
+    inside: np.ndarray,
+    dist_to_boundary: Optional[np.ndarray],
+    resolution: float,
+    transition_width: float
+) -> None:
+    """Apply a region's resolution and transition zone to cell_width in place."""
+    # Apply target resolution inside region
+    cell_width[inside] = np.minimum(cell_width[inside], resolution)
+
+    # Apply transition zone
+    if transition_width > 0:
+        # Transition zone: points outside region but within transition_width
+        in_transition = (dist_to_boundary > 0) & (dist_to_boundary <= transition_width)
+
+        # Linear interpolation from region resolution to current resolution
+        if np.any(in_transition):
+            fraction = dist_to_boundary[in_transition] / transition_width
+            outer_res = cell_width[in_transition]
+            new_res = resolution + fraction * (outer_res - resolution)
+            cell_width[in_transition] = np.minimum(
+                cell_width[in_transition], new_res
+            )
+
+
+def _apply_region_numpy(
+    region: Region,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    cell_width: np.ndarray
+) -> None:
+    """Apply a region to cell_width in place using NumPy/shapely."""
+    if isinstance(region, CircularRegion):
+        # One haversine pass over the points gives both the mask and the
+        # transition distances
+        dist_to_boundary = region.distance_to_boundary(lons, lats)
+        inside = dist_to_boundary <= 0
+    else:
+        inside = region.contains(lons, lats)
+        dist_to_boundary = None
+        if region.transition_width > 0:
+            dist_to_boundary = region.distance_to_boundary(lons, lats)
+
+    _blend_region(
+        cell_width, inside, dist_to_boundary,
+        region.resolution, region.transition_width
+    )
 
 
 def compute_cell_width(
     lons: np.ndarray,
     lats: np.ndarray,
     regions: List[Region],
-    background_resolution: float = 150.0
+    background_resolution: float = 150.0,
+    cache_dir: Optional[Union[str, Path]] = None,
+    dtype: type = np.float64
 ) -> np.ndarray:
     """
     Compute cell width array based on refinement regions.
@@ -224,13 +668,23 @@ def compute_cell_width(
     Parameters
     ----------
     lons : ndarray
-        2D array of longitudes.
+        2D array of longitudes. float32 is sufficient and halves the
+        memory traffic on large grids.
     lats : ndarray
         2D array of latitudes.
     regions : list of Region
         List of refinement regions, processed from coarsest to finest.
     background_resolution : float, optional
         Resolution for areas outside all regions (km).
+    cache_dir : str or Path, optional
+        Directory for caching the distance field of each region between
+        runs (e.g. ``~/.cache/mgrid``). Fields are keyed by the region
+        geometry and the grid, so editing one region only recomputes
+        that region. Disabled by default.
+    dtype : data-type, optional
+        Data type of the returned cell widths (default: float64). float32
+        is ample for cell widths and halves memory use on large grids;
+        distances and blending are still computed in float64.
 
     Returns
     -------
@@ -241,39 +695,80 @@ def compute_cell_width(
     -----
     Regions are processed from coarsest to finest resolution to allow
     proper nesting of refinement areas.
+
+    When numba is installed, the regions are packed into a
+    :class:`RegionBatch` and evaluated by a single compiled kernel that
+    fuses the distance calculations with the resolution blend.
+    Otherwise the NumPy implementation below is used. With ``cache_dir``
+    the blend is always done with NumPy on the cached distance fields.
     """
     # Initialize with background resolution
-    cell_width = np.full_like(lons, background_resolution, dtype=float)
+    cell_width = np.full(lons.shape, background_resolution, dtype=dtype)
 
     # Sort regions by resolution (coarsest first for proper nesting)
     sorted_regions = sorted(regions, key=lambda r: r.resolution, reverse=True)
 
-    for region in sorted_regions:
-        # Get region properties
-        res = region.resolution
-        trans_width = region.transition_width
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        grid_digest = _grid_digest(lons, lats)
 
-        # Check which points are inside
-        inside = region.contains(lons, lats)
+        for region in sorted_regions:
+            dist_to_boundary = _cached_distance_to_boundary(
+                region, lons, lats, cache_dir, grid_digest
+            )
+            # shapely's contains excludes the polygon boundary
+            if isinstance(region, PolygonRegion):
+                inside = dist_to_boundary < 0
+            else:
+                inside = dist_to_boundary <= 0
+            _blend_region(
+                cell_width, inside, dist_to_boundary,
+                region.resolution, region.transition_width
+            )
 
-        # Apply target resolution inside region
-        cell_width[inside] = np.minimum(cell_width[inside], res)
+        return cell_width
 
-        # Apply transition zone
-        if trans_width > 0:
-            dist_to_boundary = region.distance_to_boundary(lons, lats)
+    # Flat views for the compiled kernel (writes go through to cell_width).
+    # float32 coordinates are passed through without an upcast copy.
+    coord_dtype = np.result_type(lons, lats, np.float32)
+    lons_flat = np.ascontiguousarray(lons, dtype=coord_dtype).ravel()
+    lats_flat = np.ascontiguousarray(lats, dtype=coord_dtype).ravel()
+    cell_width_flat = cell_width.ravel()
 
-            # Transition zone: points outside region but within transition_width
-            in_transition = (dist_to_boundary > 0) & (dist_to_boundary <= trans_width)
+    if njit is not None and all(RegionBatch.supports(r) for r in sorted_regions):
+        RegionBatch(sorted_regions).apply(lons_flat, lats_flat, cell_width_flat)
+        return cell_width
 
-            # Linear interpolation from region resolution to current resolution
-            if np.any(in_transition):
-                fraction = dist_to_boundary[in_transition] / trans_width
-                outer_res = cell_width[in_transition]
-                new_res = res + fraction * (outer_res - res)
-                cell_width[in_transition] = np.minimum(
-                    cell_width[in_transition], new_res
-                )
+    for region in sorted_regions:
+        if njit is not None and RegionBatch.supports(region):
+            RegionBatch([region]).apply(lons_flat, lats_flat, cell_width_flat)
+            continue
+
+        # Distances are computed in float64 even for float32 grids (the
+        # compiled kernel widens each point the same way)
+        bounds = _influence_bounds(region)
+        if bounds is None:
+            _apply_region_numpy(
+                region,
+                np.asarray(lons, dtype=np.float64),
+                np.asarray(lats, dtype=np.float64),
+                cell_width
+            )
+            continue
+
+        # Only evaluate the points the region can reach
+        near = _within_bounds(region, lons, lats, bounds)
+        if not np.any(near):
+            continue
+        local = cell_width[near]
+        _apply_region_numpy(
+            region,
+            lons[near].astype(np.float64, copy=False),
+            lats[near].astype(np.float64, copy=False),
+            local
+        )
+        cell_width[near] = local
 
     return cell_width
 
@@ -334,7 +829,7 @@ def region_from_dict(config: dict) -> Region:
         )
 
     elif region_type == 'polygon':
-        vertices = [tuple(v) for v in config['polygon']]
+        vertices = np.asarray(config['polygon'], dtype=np.float64)
         return PolygonRegion(
             name=name,
             resolution=resolution,
@@ -1,9 +1,11 @@
 """Tests for the high-level API."""
 
+from pathlib import Path
+
 import numpy as np
 import pytest
 
-from m_grid.api import Grid, generate_mesh
+from m_grid.api import Grid, generate_mesh, save_grid_async
 
 
 class TestGrid:
@@ -140,3 +142,40 @@ class TestGenerateMesh:
 
         # Smaller density factor = more grid points
         assert grid1.lat.size > grid2.lat.size
+
+
+class TestSaveGridAsync:
+    """Tests for save_grid_async function."""
+
+    def test_without_mesh_file_raises(self):
+        """A grid without a mesh file is rejected before submitting."""
+        with pytest.raises(ValueError):
+            save_grid_async(Grid(), 'grid.nc')
+
+    def test_future_writes_file(self, tmp_path, monkeypatch):
+        """The returned future should complete the write and give its path."""
+        import m_grid.api as api_module
+        import m_grid.io as io_module
+
+        def fake_convert(mesh_file, output_file, output_dir=None):
+            # Stand-in for the JIGSAW -> MPAS conversion (needs mpas_tools)
+            with open(output_file, 'wb') as f:
+                np.savez(f, mesh_file=str(mesh_file))
+            return Path(output_file)
+
+        monkeypatch.setattr(io_module, 'convert_to_mpas', fake_convert)
+
+        grid = Grid(mesh_file=str(tmp_path / 'mesh.msh'))
+        future = save_grid_async(grid, tmp_path / 'grid.nc')
+        mpas_file = future.result(timeout=30)
+
+        assert mpas_file == tmp_path / 'grid.nc'
+        assert grid.mpas_file == mpas_file
+        with np.load(mpas_file) as data:
+            assert str(data['mesh_file']) == str(tmp_path / 'mesh.msh')
+
+        # Shutting down (as at interpreter exit) waits for pending writes
+        pending = save_grid_async(grid, tmp_path / 'second.nc')
+        api_module._shutdown_save_executor()
+        assert pending.done()
+        assert (tmp_path / 'second.nc').exists()
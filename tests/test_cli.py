@@ -0,0 +1,132 @@
+"""Tests for the command-line interface."""
+
+import sys
+
+import pytest
+
+import m_grid.cli as cli
+
+
+@pytest.fixture(autouse=True)
+def fresh_parser(monkeypatch):
+    """Start every test without a cached parser."""
+    monkeypatch.setattr(cli, '_PARSER', None)
+    monkeypatch.setattr(cli, '_SUBPARSERS', None)
+
+
+def run_main(monkeypatch, *args):
+    """Run cli.main() with the given arguments and return its exit code."""
+    monkeypatch.setattr(sys, 'argv', ['mgrid', *args])
+    try:
+        cli.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+class TestParser:
+    """Tests for the cached, lazily built parser."""
+
+    def test_help_lists_every_command(self, monkeypatch, capsys):
+        """Top-level help should list all subcommands in COMMANDS order."""
+        assert run_main(monkeypatch, '--help') == 0
+
+        out = capsys.readouterr().out
+        assert '{run,info}' in out
+        assert out.index('Run pipeline') < out.index('Show information')
+
+    def test_only_requested_command_is_built(self, monkeypatch, capsys):
+        """A subcommand invocation should register only that subcommand."""
+        assert run_main(monkeypatch, 'info', '-h') == 0
+        assert list(cli._SUBPARSERS.choices) == ['info']
+        assert 'MPAS grid file' in capsys.readouterr().out
+
+    def test_commands_in_same_process(self, monkeypatch, capsys):
+        """Later invocations should reuse the parser and add what they need."""
+        assert run_main(monkeypatch, 'info', '-h') == 0
+        assert run_main(monkeypatch, 'run', '-h') == 0
+        assert 'JSON configuration file' in capsys.readouterr().out
+
+        assert run_main(monkeypatch, '--help') == 0
+        assert list(cli._SUBPARSERS.choices) == ['run', 'info']
+        assert '{run,info}' in capsys.readouterr().out
+
+        parser = cli._PARSER
+        assert run_main(monkeypatch, 'info', '-h') == 0
+        assert cli._PARSER is parser
+
+    def test_unknown_command(self, monkeypatch, capsys):
+        """Unknown commands should be a usage error listing all choices."""
+        assert run_main(monkeypatch, 'bogus') == 2
+
+        err = capsys.readouterr().err
+        assert "invalid choice: 'bogus'" in err
+        assert "'run'" in err and "'info'" in err
+
+
+class TestJsonShortcut:
+    """Tests for the 'mgrid config.json' shortcut."""
+
+    def test_shortcut_matches_run(self, monkeypatch):
+        """'mgrid cfg.json' should dispatch to run with the same namespace."""
+        calls = []
+        monkeypatch.setattr(cli, '_cmd_run', calls.append)
+
+        assert run_main(monkeypatch, 'cfg.json', '--no-plot') == 0
+        argv = list(sys.argv)
+        assert run_main(monkeypatch, 'run', 'cfg.json', '--no-plot') == 0
+
+        shortcut, explicit = calls
+        assert vars(shortcut) == vars(explicit)
+        assert shortcut.command == 'run'
+        assert shortcut.config == 'cfg.json'
+        # sys.argv is left untouched
+        assert argv == ['mgrid', 'cfg.json', '--no-plot']
+
+    def test_shortcut_missing_file(self, monkeypatch, tmp_path, capsys):
+        """A missing config file should be a one-line error and exit code 1."""
+        missing = tmp_path / 'missing.json'
+        monkeypatch.delenv('MGRID_TRACEBACK', raising=False)
+
+        assert run_main(monkeypatch, str(missing)) == 1
+        assert 'Configuration file not found' in capsys.readouterr().err
+
+
+class TestTraceback:
+    """Tests for the traceback gate on errors."""
+
+    def _fail(self, monkeypatch, capsys):
+        def fail(args):
+            raise RuntimeError('boom')
+
+        monkeypatch.setattr(cli, '_cmd_run', fail)
+        assert run_main(monkeypatch, 'cfg.json') == 1
+        return capsys.readouterr().err
+
+    @pytest.mark.parametrize('value', [None, '', '0', 'false', 'False'])
+    def test_non_tty_one_line_error(self, monkeypatch, capsys, value):
+        """Without a terminal, false values keep the one-line error."""
+        monkeypatch.setattr(sys.stderr, 'isatty', lambda: False)
+        if value is None:
+            monkeypatch.delenv('MGRID_TRACEBACK', raising=False)
+        else:
+            monkeypatch.setenv('MGRID_TRACEBACK', value)
+
+        err = self._fail(monkeypatch, capsys)
+        assert 'Error: boom' in err
+        assert 'Traceback' not in err
+
+    @pytest.mark.parametrize('value', ['1', 'true', 'yes'])
+    def test_non_tty_env_enables(self, monkeypatch, capsys, value):
+        """MGRID_TRACEBACK set to a true value shows the traceback."""
+        monkeypatch.setattr(sys.stderr, 'isatty', lambda: False)
+        monkeypatch.setenv('MGRID_TRACEBACK', value)
+
+        assert 'Traceback' in self._fail(monkeypatch, capsys)
+
+    def test_tty_shows_traceback(self, monkeypatch, capsys):
+        """On a terminal the traceback is always shown."""
+        monkeypatch.setattr(sys.stderr, 'isatty', lambda: True)
+        monkeypatch.setenv('MGRID_TRACEBACK', '0')
+
+        assert 'Traceback' in self._fail(monkeypatch, capsys)
@@ -9,6 +9,7 @@ import pytest
 
 from m_grid.io import (
     load_config,
+    load_config_lazy,
     save_config,
     validate_config,
 )
@@ -66,6 +67,54 @@ class TestLoadConfig:
             Path(temp_path).unlink()
 
 
+class TestLoadConfigLazy:
+    """Tests for load_config_lazy function."""
+
+    CONFIG = {
+        'name': 'lazy',
+        'background_resolution': 100.0,
+        'regions': [
+            {'type': 'circle', 'center': [0.0, 0.0], 'radius': 100.0},
+            {'type': 'polygon', 'polygon': [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]]},
+            {'type': 'circle', 'center': [5.0, 5.0], 'radius': 50.0},
+        ],
+        'partitions': [4, 8],
+    }
+
+    def _write(self, tmp_path):
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps(self.CONFIG))
+        return path
+
+    def test_only_requested_keys(self, tmp_path):
+        """Keys outside need should not be loaded."""
+        pytest.importorskip('ijson')
+        loaded = load_config_lazy(self._write(tmp_path))
+
+        assert loaded['name'] == 'lazy'
+        assert loaded['partitions'] == [4, 8]
+        assert 'background_resolution' not in loaded
+        # Regions stop at the first polygon
+        assert [r['type'] for r in loaded['regions']] == ['circle', 'polygon']
+        assert loaded['regions'][1]['polygon'][1] == [1.0, 0.0]
+
+    def test_fallback_without_ijson(self, tmp_path, monkeypatch):
+        """Without ijson the full file is parsed and then filtered."""
+        import m_grid.io as io_module
+
+        monkeypatch.setattr(io_module, 'ijson', None)
+        loaded = load_config_lazy(self._write(tmp_path))
+
+        assert loaded['name'] == 'lazy'
+        assert 'background_resolution' not in loaded
+        assert len(loaded['regions']) == 3
+
+    def test_load_nonexistent_file(self):
+        """Loading nonexistent file should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_config_lazy('/nonexistent/path/config.json')
+
+
 class TestSaveConfig:
     """Tests for save_config function."""
 
@@ -89,6 +138,60 @@ class TestSaveConfig:
 
             assert loaded == config
 
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_utf8_round_trip(self, tmp_path, monkeypatch, use_orjson):
+        """Non-ASCII names should round-trip with and without orjson."""
+        import m_grid.io as io_module
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(io_module, 'orjson', None)
+
+        config = {'name': 'Goiás', 'regions': [{'name': 'Brasília'}]}
+        output_path = save_config(config, tmp_path / 'config.json')
+
+        assert 'Goiás' in output_path.read_text(encoding='utf-8')
+        assert load_config(output_path) == config
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    @pytest.mark.parametrize('value', [
+        float('nan'), float('inf'), np.array([1.0, np.nan]),
+    ])
+    def test_non_finite_rejected(self, tmp_path, monkeypatch, use_orjson,
+                                 value):
+        """NaN and infinity should be rejected by both serializers."""
+        import m_grid.io as io_module
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            if isinstance(value, np.ndarray):
+                pytest.skip('json cannot serialize NumPy arrays')
+            monkeypatch.setattr(io_module, 'orjson', None)
+
+        with pytest.raises(ValueError):
+            save_config({'background_resolution': value},
+                        tmp_path / 'config.json')
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    @pytest.mark.parametrize('constant', ['NaN', 'Infinity', '-Infinity'])
+    def test_load_non_finite_rejected(self, tmp_path, monkeypatch,
+                                      use_orjson, constant):
+        """NaN and Infinity in a file should be rejected by both parsers."""
+        import m_grid.io as io_module
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(io_module, 'orjson', None)
+
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(f'{{"background_resolution": {constant}}}')
+
+        with pytest.raises(ValueError):
+            load_config(config_path)
+
 
 class TestValidateConfig:
     """Tests for validate_config function."""
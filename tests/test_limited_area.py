@@ -0,0 +1,104 @@
+"""Tests for the limited-area module."""
+
+import numpy as np
+import pytest
+
+from m_grid.limited_area import generate_pts_file, generate_pts_from_config
+
+
+class TestGeneratePtsFile:
+    """Tests for generate_pts_file function."""
+
+    def test_custom_polygon_format(self, tmp_path):
+        """Vertices should be written one 'lat, lon' pair per line, as given."""
+        pts = generate_pts_file(
+            tmp_path / 'region.pts',
+            name='region',
+            region_type='custom',
+            inside_point=(-16.0, -49.5),
+            polygon=[(-12.4, -50.2), (-16, -47), (-19.5123456789, -50.8)]
+        )
+
+        assert pts.read_text().splitlines() == [
+            'Name: region',
+            'Type: custom',
+            'Point: -16.0, -49.5',
+            '-12.4, -50.2',
+            '-16, -47',
+            '-19.5123456789, -50.8',
+        ]
+
+    def test_custom_polygon_array(self, tmp_path):
+        """An (N, 2) array should give the same lines as a list of pairs."""
+        polygon = [(-12.4, -50.2), (-19.5, -50.8), (-18.7, -52.4)]
+        from_list = generate_pts_file(
+            tmp_path / 'list.pts', 'region', 'custom', (-16.0, -49.5),
+            polygon=polygon
+        )
+        from_array = generate_pts_file(
+            tmp_path / 'array.pts', 'region', 'custom', (-16.0, -49.5),
+            polygon=np.array(polygon)
+        )
+
+        assert from_array.read_text() == from_list.read_text()
+
+    def test_custom_polygon_generator(self, tmp_path):
+        """Any iterable of pairs, e.g. a generator, should be accepted."""
+        polygon = [(-12.4, -50.2), (-19.5, -50.8), (-18.7, -52.4)]
+        from_list = generate_pts_file(
+            tmp_path / 'list.pts', 'region', 'custom', (-16.0, -49.5),
+            polygon=polygon
+        )
+        from_generator = generate_pts_file(
+            tmp_path / 'generator.pts', 'region', 'custom', (-16.0, -49.5),
+            polygon=(vertex for vertex in polygon)
+        )
+
+        assert from_generator.read_text() == from_list.read_text()
+
+    @pytest.mark.parametrize('polygon', [
+        [-12.4, -50.2, -19.5, -50.8],
+        np.array([-12.4, -50.2, -19.5, -50.8]),
+        [(-12.4, -50.2, 0.0), (-19.5, -50.8, 0.0)],
+    ])
+    def test_malformed_polygon(self, tmp_path, polygon):
+        """Polygons that are not (lat, lon) pairs should be rejected."""
+        with pytest.raises(ValueError):
+            generate_pts_file(
+                tmp_path / 'bad.pts', 'region', 'custom', (-16.0, -49.5),
+                polygon=polygon
+            )
+
+    def test_custom_requires_polygon(self, tmp_path):
+        """The custom type should require a polygon."""
+        with pytest.raises(ValueError):
+            generate_pts_file(
+                tmp_path / 'bad.pts', 'region', 'custom', (-16.0, -49.5)
+            )
+
+
+class TestGeneratePtsFromConfig:
+    """Tests for generate_pts_from_config function."""
+
+    def test_vertices_written_as_given(self, tmp_path):
+        """Config vertices should be written unchanged, centroid as inside point."""
+        config = {
+            'name': 'square',
+            'regions': [{
+                'name': 'outer',
+                'type': 'polygon',
+                'polygon': [[-10, -50], [-10, -40], [-20, -40], [-20, -50]],
+            }],
+        }
+
+        pts = generate_pts_from_config(config, tmp_path / 'square.pts')
+
+        assert pts.read_text().splitlines() == [
+            'Name: square',
+            'Type: custom',
+            'Point: -15.0, -45.0',
+            '-10, -50',
+            '-10, -40',
+            '-20, -40',
+            '-20, -50',
+        ]
@@ -0,0 +1,73 @@
+"""Tests for the mesh module."""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+import m_grid.mesh as mesh_module
+from m_grid.mesh import generate_icosahedral_mesh
+
+
+def _fake_jigsawpy(calls):
+    """Minimal jigsawpy stand-in whose icosahedron writes a mesh file."""
+    def icosahedron(opts, level, mesh):
+        calls.append(level)
+        with open(opts.mesh_file, 'w') as f:
+            f.write(f'level {level}\n')
+
+    msh_t = type('jigsaw_msh_t', (), {'REALS_t': np.float64})
+    return types.SimpleNamespace(
+        jigsaw_jig_t=types.SimpleNamespace,
+        jigsaw_msh_t=msh_t,
+        savemsh=lambda path, mesh: None,
+        cmd=types.SimpleNamespace(icosahedron=icosahedron),
+    )
+
+
+class TestIcosahedralMeshCache:
+    """Tests for the cache_dir option of generate_icosahedral_mesh."""
+
+    def test_cache_hit_skips_jigsaw(self, tmp_path, monkeypatch):
+        """A cached level should be copied without running JIGSAW."""
+        cache_dir = tmp_path / 'cache'
+        cache_dir.mkdir()
+        (cache_dir / 'icosahedron_level3.msh').write_text('cached mesh\n')
+
+        def fail():
+            raise AssertionError('JIGSAW should not run on a cache hit')
+
+        monkeypatch.setattr(mesh_module, '_check_jigsawpy_available', fail)
+
+        mesh_file = generate_icosahedral_mesh(
+            tmp_path / 'grid', level=3, cache_dir=cache_dir
+        )
+
+        assert mesh_file == tmp_path / 'grid-MESH.msh'
+        assert mesh_file.read_text() == 'cached mesh\n'
+
+    def test_cache_miss_stores_mesh(self, tmp_path, monkeypatch):
+        """A new level should be built once and stored in the cache."""
+        calls = []
+        monkeypatch.setattr(mesh_module, '_check_jigsawpy_available',
+                            lambda: True)
+        monkeypatch.setitem(sys.modules, 'jigsawpy', _fake_jigsawpy(calls))
+        cache_dir = tmp_path / 'cache'
+
+        first = generate_icosahedral_mesh(
+            tmp_path / 'first', level=2, cache_dir=cache_dir
+        )
+        second = generate_icosahedral_mesh(
+            tmp_path / 'second', level=2, cache_dir=cache_dir
+        )
+
+        assert calls == [2]
+        assert (cache_dir / 'icosahedron_level2.msh').read_text() == 'level 2\n'
+        assert second.read_text() == first.read_text()
+        assert list(cache_dir.glob('*.tmp')) == []
+
+    def test_invalid_level(self, tmp_path):
+        """Levels outside 0-12 should be rejected."""
+        with pytest.raises(ValueError):
+            generate_icosahedral_mesh(tmp_path / 'grid', level=13)
@@ -0,0 +1,35 @@
+"""Tests for the package namespace."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import m_grid
+
+
+def test_public_names_resolve():
+    """Every name in __all__ should be importable from the package."""
+    for name in m_grid.__all__:
+        assert getattr(m_grid, name) is not None, name
+
+
+def test_submodules_and_names_are_lazy():
+    """Submodules load on attribute access in a fresh interpreter."""
+    package = m_grid.__name__
+    code = (
+        f"import sys, {package} as pkg\n"
+        f"assert '{package}.regions' not in sys.modules\n"
+        "assert pkg.regions.CircularRegion is pkg.CircularRegion\n"
+        "assert pkg.api.generate_mesh is pkg.generate_mesh\n"
+        "assert pkg.io.load_config is pkg.load_config\n"
+        "assert 'regions' in dir(pkg)\n"
+    )
+    env = dict(os.environ)
+    env['PYTHONPATH'] = str(Path(m_grid.__file__).resolve().parent.parent)
+
+    result = subprocess.run(
+        [sys.executable, '-c', code], env=env,
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
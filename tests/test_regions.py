@@ -6,6 +6,7 @@ import pytest
 from m_grid.regions import (
     CircularRegion,
     PolygonRegion,
+    RegionBatch,
     compute_cell_width,
     region_from_dict,
     regions_from_config,
@@ -135,6 +136,26 @@ class TestPolygonRegion:
         inside = square_region.contains(lons, lats)
         assert inside[0, 0] == True
 
+    def test_array_vertices(self):
+        """Vertices can be given as an (N, 2) array."""
+        region = PolygonRegion(
+            name='Square',
+            resolution=5.0,
+            transition_width=20.0,
+            vertices=np.array([
+                [-10.0, -10.0],
+                [-10.0, 10.0],
+                [10.0, 10.0],
+                [10.0, -10.0],
+            ])
+        )
+
+        lons = np.array([[0.0, 50.0]])
+        lats = np.array([[0.0, 50.0]])
+
+        inside = region.contains(lons, lats)
+        np.testing.assert_array_equal(inside, [[True, False]])
+
 
 class TestComputeCellWidth:
     """Tests for compute_cell_width function."""
@@ -210,6 +231,225 @@ class TestComputeCellWidth:
         center_idx = 3
         assert cell_width[center_idx, center_idx] == 5.0
 
+    @pytest.mark.parametrize('dtype', [np.float32, np.float64])
+    @pytest.mark.parametrize('compiled', [True, False])
+    def test_polygon_boundary_point(self, dtype, compiled, monkeypatch):
+        """
+        Points on a polygon edge or vertex keep the background resolution.
+
+        shapely does not count boundary points as contained and their
+        distance to the boundary is 0, which is outside the transition
+        zone (0, transition_width]. Both kernels and both coordinate dtypes
+        must agree on this.
+        """
+        pytest.importorskip('shapely')
+        import m_grid.regions as regions_module
+
+        if compiled:
+            pytest.importorskip('numba')
+        else:
+            monkeypatch.setattr(regions_module, 'njit', None)
+
+        region = PolygonRegion(
+            name='Square',
+            resolution=5.0,
+            transition_width=20.0,
+            vertices=[(-10.0, -10.0), (-10.0, 10.0), (10.0, 10.0), (10.0, -10.0)]
+        )
+
+        # Inside, on each edge, on a vertex, and just outside the east edge
+        lons = np.array([[0.0, 10.0, -10.0, 0.0, 0.0, 10.0, 10.1]], dtype=dtype)
+        lats = np.array([[0.0, 0.0, 0.0, 10.0, -10.0, 10.0, 0.0]], dtype=dtype)
+
+        cell_width = compute_cell_width(
+            lons, lats, [region], background_resolution=100.0
+        )
+
+        assert cell_width.dtype == np.float64
+        assert cell_width[0, 0] == 5.0
+        np.testing.assert_allclose(cell_width[0, 1:6], 100.0)
+        # ~11 km outside a 20 km transition: blended, not background
+        assert 5.0 < cell_width[0, 6] < 100.0
+
+    def test_float32_output(self):
+        """Cell widths can be returned as float32."""
+        region = CircularRegion(
+            name='Test',
+            resolution=5.0,
+            transition_width=20.0,
+            center=(0.0, 0.0),
+            radius=100.0
+        )
+
+        lons, lats = np.meshgrid(
+            np.linspace(-5, 5, 11),
+            np.linspace(-5, 5, 11)
+        )
+
+        reference = compute_cell_width(lons, lats, [region], 100.0)
+        cell_width = compute_cell_width(
+            lons, lats, [region], 100.0, dtype=np.float32
+        )
+
+        assert cell_width.dtype == np.float32
+        np.testing.assert_allclose(cell_width, reference, rtol=1e-6)
+
+    @pytest.mark.parametrize('compiled', [True, False])
+    def test_float32_coordinates(self, compiled, monkeypatch):
+        """float32 grids should give the same cell widths as float64 ones."""
+        pytest.importorskip('shapely')
+        import m_grid.regions as regions_module
+
+        if compiled:
+            pytest.importorskip('numba')
+        else:
+            monkeypatch.setattr(regions_module, 'njit', None)
+
+        regions = [
+            CircularRegion(
+                name='Circle', resolution=5.0, transition_width=50.0,
+                center=(-15.3, -47.8), radius=150.0
+            ),
+            PolygonRegion(
+                name='Polygon', resolution=10.0, transition_width=80.0,
+                vertices=[(-20.0, -55.0), (-20.0, -45.0), (-12.0, -45.0),
+                          (-12.0, -55.0)]
+            ),
+        ]
+
+        lons32, lats32 = np.meshgrid(
+            np.linspace(-60, -40, 81, dtype=np.float32),
+            np.linspace(-25, -5, 81, dtype=np.float32)
+        )
+
+        result32 = compute_cell_width(lons32, lats32, regions, 100.0)
+        result64 = compute_cell_width(
+            lons32.astype(np.float64), lats32.astype(np.float64), regions, 100.0
+        )
+
+        np.testing.assert_allclose(result32, result64, rtol=0, atol=1e-9)
+
+    def test_compiled_matches_numpy(self, monkeypatch):
+        """Numba kernels should reproduce the NumPy implementation."""
+        pytest.importorskip('numba')
+        pytest.importorskip('shapely')
+        import m_grid.regions as regions_module
+
+        regions = [
+            PolygonRegion(
+                name='Triangle',
+                resolution=20.0,
+                transition_width=300.0,
+                vertices=[(-25.0, -60.0), (-5.0, -40.0), (-28.0, -38.0)]
+            ),
+            CircularRegion(
+                name='Circle',
+                resolution=5.0,
+                transition_width=50.0,
+                center=(-15.0, -50.0),
+                radius=300.0
+            ),
+        ]
+
+        lons, lats = np.meshgrid(
+            np.linspace(-70, -30, 81),
+            np.linspace(-35, 0, 71)
+        )
+
+        compiled = compute_cell_width(lons, lats, regions, 150.0)
+        monkeypatch.setattr(regions_module, 'njit', None)
+        reference = compute_cell_width(lons, lats, regions, 150.0)
+
+        np.testing.assert_allclose(compiled, reference, rtol=1e-9)
+
+    def test_circle_across_antimeridian(self, monkeypatch):
+        """Region bounds should wrap longitudes on 0-360 grids."""
+        import m_grid.regions as regions_module
+
+        region = CircularRegion(
+            name='Pacific',
+            resolution=10.0,
+            transition_width=100.0,
+            center=(0.0, -175.0),
+            radius=500.0
+        )
+
+        lons, lats = np.meshgrid(
+            np.linspace(170, 200, 31),
+            np.linspace(-10, 10, 21)
+        )
+        dist = region.distance_to_boundary(lons, lats)
+        expected = np.where(
+            dist <= 0, 10.0,
+            np.minimum(150.0, 10.0 + np.clip(dist, 0, 100.0) / 100.0 * 140.0)
+        )
+
+        result = compute_cell_width(lons, lats, [region], 150.0)
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+        assert result[10, 15] == 10.0  # lon 185 == -175
+
+        monkeypatch.setattr(regions_module, 'njit', None)
+        result = compute_cell_width(lons, lats, [region], 150.0)
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_cache_dir_reuses_distance_fields(self, tmp_path):
+        """Cached fields should match and be reused across resolutions."""
+        region = CircularRegion(
+            name='Circle',
+            resolution=10.0,
+            transition_width=100.0,
+            center=(-15.0, -50.0),
+            radius=300.0
+        )
+
+        lons, lats = np.meshgrid(
+            np.linspace(-70, -30, 41),
+            np.linspace(-35, 0, 36)
+        )
+
+        reference = compute_cell_width(lons, lats, [region], 100.0)
+        first = compute_cell_width(
+            lons, lats, [region], 100.0, cache_dir=tmp_path
+        )
+        cached_files = sorted(tmp_path.glob('*.npy'))
+        assert len(cached_files) == 1
+        assert list(tmp_path.glob('*.tmp')) == []
+
+        np.testing.assert_allclose(first, reference, rtol=1e-5)
+
+        # Changing only the resolution reuses the cached field
+        region.resolution = 20.0
+        second = compute_cell_width(
+            lons, lats, [region], 100.0, cache_dir=tmp_path
+        )
+        assert sorted(tmp_path.glob('*.npy')) == cached_files
+        assert second.min() == pytest.approx(20.0)
+
+
+class TestRegionBatch:
+    """Tests for the RegionBatch struct-of-arrays layout."""
+
+    def test_csr_layout(self):
+        """Polygon vertices should be concatenated as (lon, lat)."""
+        regions = [
+            CircularRegion(
+                name='Circle', resolution=10.0, transition_width=50.0,
+                center=(-15.0, -50.0), radius=200.0
+            ),
+            PolygonRegion(
+                name='Triangle', resolution=5.0, transition_width=20.0,
+                vertices=[(-25.0, -60.0), (-5.0, -40.0), (-28.0, -38.0)]
+            ),
+        ]
+
+        batch = RegionBatch(regions)
+
+        assert len(batch) == 2
+        np.testing.assert_array_equal(batch.starts, [0, 0, 3])
+        np.testing.assert_array_equal(batch.resolutions, [10.0, 5.0])
+        np.testing.assert_array_equal(batch.centers[0], [-15.0, -50.0])
+        np.testing.assert_array_equal(batch.verts[0], [-60.0, -25.0])
+
 
 class TestRegionFromDict:
     """Tests for region_from_dict function."""